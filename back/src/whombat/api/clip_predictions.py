@@ -1,6 +1,7 @@
 """Python API for managing clip predictions."""
 
 from pathlib import Path
+from typing import Sequence
 from uuid import UUID
 
 from soundevent import data
@@ -86,27 +87,64 @@ class ClipPredictionAPI(
             Clip prediction with the added tag.
         """
         for t in obj.tags:
-            if (t.tag.key, t.tag.value) == (tag.key, tag.value):
+            if t.tag.id == tag.id:
                 raise exceptions.DuplicateObjectError(
                     f"Tag {tag} already exists in clip prediction {obj.id}"
                 )
 
-        db_tag = await common.create_object(
+        predicted_tag = schemas.PredictedTag(tag=tag, score=score)
+        await common.insert_object(
             session,
             models.ClipPredictionTag,
             clip_prediction_id=obj.id,
             tag_id=tag.id,
             score=score,
+            created_on=predicted_tag.created_on,
         )
 
-        obj = obj.model_copy(
-            update=dict(
-                tags=[
-                    *obj.tags,
-                    schemas.PredictedTag.model_validate(db_tag),
-                ],
-            )
+        obj = obj.model_copy(update=dict(tags=[*obj.tags, predicted_tag]))
+        self._update_cache(obj)
+        return obj
+
+    async def add_tags(
+        self,
+        session: AsyncSession,
+        obj: schemas.ClipPrediction,
+        predicted_tags: Sequence[tuple[schemas.Tag, float]],
+    ) -> schemas.ClipPrediction:
+        """Add multiple tags to a clip prediction at once.
+
+        Tags that the prediction already has are skipped. If a tag is
+        repeated, only its first score is kept.
+
+        Parameters
+        ----------
+        session
+            SQLAlchemy AsyncSession to use for the database connection.
+        obj
+            Clip prediction to add the tags to.
+        predicted_tags
+            Pairs of tag and score to add.
+
+        Returns
+        -------
+        clip_prediction : schemas.ClipPrediction
+            Clip prediction with the added tags.
+        """
+        new_tags = await common.add_predicted_tags(
+            session,
+            models.ClipPredictionTag,
+            obj.tags,
+            [
+                schemas.PredictedTag(tag=tag, score=score)
+                for tag, score in predicted_tags
+            ],
+            clip_prediction_id=obj.id,
         )
+        if not new_tags:
+            return obj
+
+        obj = obj.model_copy(update=dict(tags=[*obj.tags, *new_tags]))
         self._update_cache(obj)
         return obj
 
@@ -290,19 +328,15 @@ class ClipPredictionAPI(
                 clip_prediction=clip_prediction,
             )
 
-        for predicted_tag in data.tags:
-            tag = await tags.from_soundevent(
-                session,
-                predicted_tag.tag,
-            )
-            clip_prediction = await self.add_tag(
-                session,
-                clip_prediction,
-                tag,
-                predicted_tag.score,
-            )
-
-        return clip_prediction
+        db_tags = await tags.from_soundevent_many(
+            session,
+            [predicted_tag.tag for predicted_tag in data.tags],
+        )
+        predicted_tags = [
+            (tag, predicted_tag.score)
+            for tag, predicted_tag in zip(db_tags, data.tags, strict=True)
+        ]
+        return await self.add_tags(session, clip_prediction, predicted_tags)
 
 
 clip_predictions = ClipPredictionAPI()
@@ -4,6 +4,7 @@ from whombat.api.common.base import BaseAPI
 from whombat.api.common.utils import (
     add_feature_to_object,
     add_note_to_object,
+    add_predicted_tags,
     add_tag_to_object,
     create_object,
     create_objects,
@@ -14,7 +15,9 @@ from whombat.api.common.utils import (
     get_objects,
     get_objects_from_query,
     get_or_create_object,
+    get_rows,
     insert_batched,
+    insert_object,
     remove_feature_from_object,
     remove_note_from_object,
     remove_tag_from_object,
@@ -27,6 +30,7 @@ __all__ = [
     "BaseAPI",
     "add_feature_to_object",
     "add_note_to_object",
+    "add_predicted_tags",
     "add_tag_to_object",
     "create_object",
     "create_objects",
@@ -37,7 +41,9 @@ __all__ = [
     "get_objects",
     "get_objects_from_query",
     "get_or_create_object",
+    "get_rows",
     "insert_batched",
+    "insert_object",
     "remove_feature_from_object",
     "remove_note_from_object",
     "remove_tag_from_object",
@@ -1,10 +1,11 @@
 """Base API interface."""
 
 from abc import ABC
+from functools import cached_property
 from typing import Any, Generic, Hashable, Sequence, TypeVar
 
 import cachetools
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import InstrumentedAttribute
 from sqlalchemy.sql._typing import _ColumnExpressionArgument
@@ -19,6 +20,7 @@ from whombat.api.common.utils import (
     find_object,
     get_object,
     get_objects,
+    get_rows,
     update_object,
 )
 from whombat.filters.base import Filter
@@ -43,6 +45,12 @@ class BaseAPI(
     _schema: type[WhombatSchema]
     _model: type[WhombatModel]
     _cache: cachetools.LRUCache
+    _flat_schema: bool = False
+    """Whether the schema only holds columns of the model's table.
+
+    Flat schemas are validated straight from the table rows in
+    `get_many`, which skips building ORM objects.
+    """
 
     def __init__(self):
         self._cache = cachetools.LRUCache(maxsize=1000)
@@ -104,6 +112,7 @@ class BaseAPI(
         offset: int | None = 0,
         filters: Sequence[Filter | _ColumnExpressionArgument] | None = None,
         sort_by: _ColumnExpressionArgument | str | None = "-created_on",
+        with_count: bool = True,
     ) -> tuple[Sequence[WhombatSchema], int]:
         """Get many objects.
 
@@ -119,6 +128,9 @@ class BaseAPI(
             A list of filters to apply, by default None
         sort_by
             The column to sort by, by default None
+        with_count
+            Whether to count the total number of objects, by default True.
+            If False, the returned count is -1.
 
         Returns
         -------
@@ -128,6 +140,18 @@ class BaseAPI(
             The total number of objects. This is the number of objects that
             would have been returned if no limit or offset was applied.
         """
+        if self._flat_schema:
+            rows, count = await get_rows(
+                session,
+                self._model,
+                limit=limit,
+                offset=offset,
+                filters=filters,
+                sort_by=sort_by,
+                with_count=with_count,
+            )
+            return self._validate_many(rows), count
+
         objs, count = await get_objects(
             session,
             self._model,
@@ -135,8 +159,9 @@ class BaseAPI(
             offset=offset,
             filters=filters,
             sort_by=sort_by,
+            with_count=with_count,
         )
-        return [self._schema.model_validate(obj) for obj in objs], count
+        return self._validate_many(objs), count
 
     async def _create(
         self,
@@ -240,7 +265,7 @@ class BaseAPI(
             key_column,
             return_all=return_all,
         )
-        return [self._schema.model_validate(obj) for obj in objs]
+        return self._validate_many(objs)
 
     async def delete(
         self,
@@ -365,14 +390,28 @@ class BaseAPI(
         pk = self._get_pk_from_obj(obj)
         self._cache.pop(pk, None)
 
-    def _get_pk_condition(self, pk: PrimaryKey) -> _ColumnExpressionArgument:
+    @cached_property
+    def _list_adapter(self) -> TypeAdapter[list[WhombatSchema]]:
+        """Validator for lists of schemas, built once per API."""
+        return TypeAdapter(list[self._schema])
+
+    def _validate_many(self, objs: Sequence[Any]) -> list[WhombatSchema]:
+        """Validate many objects into schemas in a single call."""
+        return self._list_adapter.validate_python(objs, from_attributes=True)
+
+    @cached_property
+    def _pk_column(self) -> InstrumentedAttribute:
+        """The column holding the primary key, resolved once per API."""
         column = getattr(self._model, "uuid", None)
-        if not column:
+        if column is None:
             raise NotImplementedError(
                 f"The model {self._model.__name__} does not have a column named"
                 " uuid"
             )
-        return column == pk
+        return column
+
+    def _get_pk_condition(self, pk: PrimaryKey) -> _ColumnExpressionArgument:
+        return self._pk_column == pk
 
     def _get_pk_from_obj(self, obj: WhombatSchema) -> PrimaryKey:
         pk = getattr(obj, "uuid", None)
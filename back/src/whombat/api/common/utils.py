@@ -1,12 +1,14 @@
 """Common API functions."""
 
+import datetime
+import os
 import re
 from dataclasses import MISSING, fields
-from itertools import batched
-from typing import Any, Callable, Sequence, TypeVar
+from typing import Any, Callable, Protocol, Sequence, TypeVar
+from uuid import UUID, uuid4
 
 from pydantic import BaseModel
-from sqlalchemy import Result, Select, func, insert, select
+from sqlalchemy import Result, RowMapping, Select, func, insert, select
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.inspection import inspect
@@ -16,12 +18,13 @@ from sqlalchemy.sql.base import ExecutableOption
 from sqlalchemy.sql.expression import ColumnElement
 
 from whombat import exceptions, models
-from whombat.core.common import remove_duplicates
+from whombat.core.common import batched, remove_duplicates
 from whombat.filters.base import Filter
 
 __all__ = [
     "add_feature_to_object",
     "add_note_to_object",
+    "add_predicted_tags",
     "add_tag_to_object",
     "create_object",
     "create_objects",
@@ -32,6 +35,8 @@ __all__ = [
     "get_objects",
     "get_objects_from_query",
     "get_or_create_object",
+    "get_rows",
+    "insert_object",
     "remove_feature_from_object",
     "remove_note_from_object",
     "remove_tag_from_object",
@@ -45,6 +50,25 @@ B = TypeVar("B", bound=BaseModel)
 F = TypeVar("F", bound=models.Base)
 
 
+class _Identified(Protocol):
+    @property
+    def id(self) -> int: ...
+
+
+class _PredictedTag(Protocol):
+    @property
+    def tag(self) -> _Identified: ...
+
+    @property
+    def score(self) -> float: ...
+
+    @property
+    def created_on(self) -> datetime.datetime: ...
+
+
+P = TypeVar("P", bound=_PredictedTag)
+
+
 pattern = re.compile(r"(?<!^)(?=[A-Z])")
 
 
@@ -243,6 +267,7 @@ async def get_objects_from_query(
     filters: Sequence[Filter | _ColumnExpressionArgument] | None = None,
     sort_by: _ColumnExpressionArgument | str | None = None,
     group_by: _ColumnExpressionArgument | None = None,
+    with_count: bool = True,
 ) -> tuple[Result[Any], int]:
     """Get a list of objects from a query.
 
@@ -262,6 +287,9 @@ async def get_objects_from_query(
         A list of filters to apply, by default None
     sort_by
         The column to sort by, by default None
+    with_count
+        Whether to run a query to count the total number of objects, by
+        default True. If False, the returned count is -1.
 
     Returns
     -------
@@ -284,7 +312,7 @@ async def get_objects_from_query(
     if group_by is not None:
         query = query.group_by(group_by)
 
-    count = await get_count(session, model, query)
+    count = await get_count(session, model, query) if with_count else -1
 
     if sort_by is not None:
         if isinstance(sort_by, str):
@@ -310,6 +338,7 @@ async def get_objects(
     filters: Sequence[Filter | _ColumnExpressionArgument] | None = None,
     options: Sequence[ExecutableOption] | None = None,
     sort_by: _ColumnExpressionArgument | str | None = None,
+    with_count: bool = True,
 ) -> tuple[Sequence[A], int]:
     """Get all objects.
 
@@ -327,6 +356,9 @@ async def get_objects(
         A list of filters to apply, by default None
     sort_by
         The column to sort by, by default None
+    with_count
+        Whether to count the total number of objects, by default True. If
+        False, the returned count is -1.
 
     Returns
     -------
@@ -336,6 +368,10 @@ async def get_objects(
         The total number of objects. This is the number of objects that would
         have been returned if no limit or offset was applied.
     """
+    # NOTE: Without limit or offset all matching objects are returned, so
+    # they can be counted directly instead of issuing a COUNT query. This
+    # matters for exports, which load whole collections.
+    unbounded = (limit is None or limit < 0) and not offset
     query = select(model)
     result, count = await get_objects_from_query(
         session,
@@ -346,8 +382,72 @@ async def get_objects(
         offset=offset,
         filters=filters,
         sort_by=sort_by,
+        with_count=with_count and not unbounded,
+    )
+    objs = result.unique().scalars().all()
+    if with_count and unbounded:
+        count = len(objs)
+    return objs, count
+
+
+async def get_rows(
+    session: AsyncSession,
+    model: type[A],
+    *,
+    limit: int | None = 1000,
+    offset: int | None = 0,
+    filters: Sequence[Filter | _ColumnExpressionArgument] | None = None,
+    sort_by: _ColumnExpressionArgument | str | None = None,
+    with_count: bool = True,
+) -> tuple[Sequence[RowMapping], int]:
+    """Get the table rows of a model.
+
+    Works like `get_objects` but selects the table of the model instead
+    of the ORM entity, so no ORM objects are built. Each row is a mapping
+    from column name to value.
+
+    Parameters
+    ----------
+    session
+        The database session to use.
+    model
+        The model to query.
+    limit
+        The maximum number of rows to return, by default 1000
+    offset
+        The offset to use, by default 0
+    filters
+        A list of filters to apply, by default None
+    sort_by
+        The column to sort by, by default None
+    with_count
+        Whether to count the total number of rows, by default True. If
+        False, the returned count is -1.
+
+    Returns
+    -------
+    list[RowMapping]
+        The rows.
+    count : int
+        The total number of rows. This is the number of rows that would
+        have been returned if no limit or offset was applied.
+    """
+    unbounded = (limit is None or limit < 0) and not offset
+    query = select(inspect(model).local_table)
+    result, count = await get_objects_from_query(
+        session,
+        model,
+        query,
+        limit=limit,
+        offset=offset,
+        filters=filters,
+        sort_by=sort_by,
+        with_count=with_count and not unbounded,
     )
-    return result.unique().scalars().all(), count
+    rows = result.mappings().all()
+    if with_count and unbounded:
+        count = len(rows)
+    return rows, count
 
 
 async def create_object(
@@ -392,6 +492,43 @@ async def create_object(
     return obj
 
 
+async def insert_object(
+    session: AsyncSession,
+    model: type[A],
+    **kwargs: Any,
+) -> None:
+    """Insert a single row without loading it back.
+
+    Use this instead of `create_object` when the created object is not
+    needed, such as for association rows, to save the refresh round-trip.
+
+    Parameters
+    ----------
+    session
+        The database session to use.
+    model
+        The model to insert.
+    **kwargs
+        The values of the row.
+
+    Raises
+    ------
+    exceptions.DuplicateObjectError
+        If the row violates a unique constraint.
+    """
+    default_values, default_factories = _get_defaults(model)
+    values = _add_defaults(kwargs, default_values, default_factories)
+    try:
+        await session.execute(insert(model).values(values))
+    except IntegrityError as e:
+        await session.rollback()
+        raise exceptions.DuplicateObjectError(
+            f"A {model.__name__} could not be created due to a duplicate"
+            " object error. This is likely due to a unique constraint"
+            f" violation. Data: {kwargs}"
+        ) from e
+
+
 async def create_objects(
     session: AsyncSession,
     model: type[A],
@@ -419,6 +556,7 @@ async def create_objects(
     """
     values = [get_values(obj) for obj in data]
     default_values, default_factories = _get_defaults(model)
+    _add_uuid_defaults(values, default_factories)
     values = [
         _add_defaults(value, default_values, default_factories)
         for value in values
@@ -464,7 +602,9 @@ async def create_objects_without_duplicates(
     Returns
     -------
     Sequence[A]
-        Will only return the created objects, not the existing ones.
+        Will only return the created objects, not the existing ones, unless
+        `return_all` is True. The objects are in the order of `data`, with
+        duplicates removed.
 
     Raises
     ------
@@ -476,6 +616,8 @@ async def create_objects_without_duplicates(
     data = remove_duplicates(list(data), key=key)
 
     # Get existing objects
+    # NOTE: Keys are computed once per object and reused below, as the key
+    # function is called for every row of potentially large imports.
     all_keys = [key(obj) for obj in data]
     existing = await get_objects_by_keys_batched(
         session,
@@ -486,33 +628,60 @@ async def create_objects_without_duplicates(
     existing_keys = {key(obj.__dict__) for obj in existing}
 
     # Create missing objects
-    missing = [obj for obj in data if key(obj) not in existing_keys]
+    missing = []
+    keys = []
+    for obj, obj_key in zip(data, all_keys, strict=True):
+        if obj_key not in existing_keys:
+            missing.append(obj)
+            keys.append(obj_key)
+
     if not missing and not return_all:
         return []
 
     if not missing:
-        return existing
+        return _sort_by_keys(existing, key, all_keys)
 
     values = [get_values(obj) for obj in missing]
     default_values, default_factories = _get_defaults(model)
+    _add_uuid_defaults(values, default_factories)
     values = [
         _add_defaults(value, default_values, default_factories)
         for value in values
     ]
-    keys = [key(obj) for obj in missing]
 
     for batch in batched(values, rows_batch):
         stmt = insert(model).values(batch)
         await session.execute(stmt)
         await session.flush()
 
-    return await get_objects_by_keys_batched(
+    # NOTE: Only the new objects are fetched, the existing ones were
+    # already loaded above.
+    created = await get_objects_by_keys_batched(
         session,
         model,
         key_column,
-        all_keys if return_all else keys,
+        keys,
     )
 
+    if return_all:
+        return _sort_by_keys([*existing, *created], key, all_keys)
+
+    return _sort_by_keys(created, key, keys)
+
+
+def _sort_by_keys(
+    objs: Sequence[A],
+    key: Callable[[dict], Any],
+    keys: Sequence[Any],
+) -> list[A]:
+    """Sort objects into the order of their keys.
+
+    Objects whose key is not in `keys` are kept at the end.
+    """
+    by_key = {key(vars(obj)): obj for obj in objs}
+    ordered = [by_key.pop(obj_key) for obj_key in keys if obj_key in by_key]
+    return [*ordered, *by_key.values()]
+
 
 async def get_objects_by_keys_batched(
     session: AsyncSession,
@@ -1100,6 +1269,62 @@ async def remove_feature_from_object(
     return obj
 
 
+async def add_predicted_tags(
+    session: AsyncSession,
+    model: type[A],
+    existing: Sequence[_PredictedTag],
+    predicted_tags: Sequence[P],
+    **kwargs: Any,
+) -> list[P]:
+    """Add tags with a score to a prediction in a single insert.
+
+    Tags are matched by id. Tags in `existing` are skipped, and if a tag
+    is repeated only its first score is kept.
+
+    Parameters
+    ----------
+    session
+        The database session to use.
+    model
+        The association model between the prediction and its tags.
+    existing
+        The predicted tags the prediction already has.
+    predicted_tags
+        The predicted tags to add.
+    **kwargs
+        The foreign key of the prediction, e.g. `clip_prediction_id`.
+
+    Returns
+    -------
+    list[P]
+        The predicted tags that were added.
+    """
+    seen = {predicted_tag.tag.id for predicted_tag in existing}
+    new_tags = []
+    for predicted_tag in predicted_tags:
+        if predicted_tag.tag.id in seen:
+            continue
+        seen.add(predicted_tag.tag.id)
+        new_tags.append(predicted_tag)
+
+    if new_tags:
+        await create_objects(
+            session,
+            model,
+            [
+                dict(
+                    **kwargs,
+                    tag_id=predicted_tag.tag.id,
+                    score=predicted_tag.score,
+                    created_on=predicted_tag.created_on,
+                )
+                for predicted_tag in new_tags
+            ],
+        )
+
+    return new_tags
+
+
 def _get_defaults(model: type[A]):
     """Get the default values from a model.
 
@@ -1156,3 +1381,44 @@ def _add_defaults(
         if key not in data:
             data[key] = value()
     return data
+
+
+def _uuid4_batch(n: int) -> list[UUID]:
+    """Generate many random UUIDs at once.
+
+    Equivalent to calling `uuid4` n times, but reads the random bytes for
+    all UUIDs with a single call to `os.urandom`.
+
+    Parameters
+    ----------
+    n : int
+        The number of UUIDs to generate.
+
+    Returns
+    -------
+    list[UUID]
+        The generated UUIDs.
+    """
+    raw = os.urandom(16 * n)
+    return [
+        UUID(bytes=raw[start : start + 16], version=4)
+        for start in range(0, 16 * n, 16)
+    ]
+
+
+def _add_uuid_defaults(values: list[dict], default_factories: dict) -> None:
+    """Fill in missing UUID defaults for many rows at once.
+
+    Parameters
+    ----------
+    values : list[dict]
+        The rows to insert. Rows without a uuid are updated in place.
+    default_factories : dict
+        The default factories of the model, as returned by `_get_defaults`.
+    """
+    if default_factories.get("uuid") is not uuid4:
+        return
+
+    missing = [value for value in values if "uuid" not in value]
+    for value, uuid in zip(missing, _uuid4_batch(len(missing)), strict=True):
+        value["uuid"] = uuid
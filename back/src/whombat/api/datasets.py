@@ -11,6 +11,7 @@ from soundevent import data
 from soundevent.io.aoef import AOEFObject, to_aeof
 from sqlalchemy import select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from whombat import exceptions, models, schemas
 from whombat.api import common
@@ -390,6 +391,18 @@ class DatasetAPI(
                 *(filters or []),
             ],
             sort_by=sort_by,
+            # NOTE: Recordings join all of their collections by default, which
+            # repeats every recording row once per combination of its notes,
+            # tags, features and owners. Loading each collection with its own
+            # IN query keeps the result proportional to the number of items.
+            options=[
+                selectinload(models.Recording.notes),
+                selectinload(models.Recording.tags),
+                selectinload(models.Recording.features),
+                selectinload(models.Recording.owners),
+                selectinload(models.Recording.recording_notes),
+                selectinload(models.Recording.recording_owners),
+            ],
         )
         return [
             schemas.Recording.model_validate(x) for x in database_recordings
@@ -516,13 +529,18 @@ class DatasetAPI(
             created_on=data.created_on,
         )
 
-        for rec in data.recordings:
-            recording = await recordings.from_soundevent(
+        recording_list = [
+            await recordings.from_soundevent(
                 session,
                 rec.model_copy(update=dict(path=dataset_audio_dir / rec.path)),
                 audio_dir=audio_dir,
             )
-            await self.add_recording(session, obj, recording)
+            for rec in data.recordings
+        ]
+
+        # NOTE: Link all recordings at once so that the dataset recordings
+        # are inserted in batches instead of one flush per recording.
+        await self.add_recordings(session, obj, recording_list)
 
         obj = obj.model_copy(update=dict(recording_count=len(data.recordings)))
         self._update_cache(obj)
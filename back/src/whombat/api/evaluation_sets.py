@@ -13,6 +13,7 @@ from whombat.api.clip_annotations import clip_annotations
 from whombat.api.common import (
     BaseAPI,
     create_object,
+    create_objects,
     create_objects_without_duplicates,
     delete_object,
 )
@@ -104,6 +105,34 @@ class EvaluationSetAPI(
         )
         return obj
 
+    async def add_clip_annotations(
+        self,
+        session: AsyncSession,
+        obj: schemas.EvaluationSet,
+        annotations: Sequence[schemas.ClipAnnotation],
+    ) -> schemas.EvaluationSet:
+        """Add multiple clip annotations to an evaluation set.
+
+        Annotations that are already in the evaluation set are skipped.
+        """
+        await create_objects_without_duplicates(
+            session,
+            model=models.EvaluationSetAnnotation,
+            data=[
+                dict(
+                    evaluation_set_id=obj.id,
+                    clip_annotation_id=annotation.id,
+                )
+                for annotation in annotations
+            ],
+            key=lambda x: (x["evaluation_set_id"], x["clip_annotation_id"]),
+            key_column=tuple_(
+                models.EvaluationSetAnnotation.evaluation_set_id,
+                models.EvaluationSetAnnotation.clip_annotation_id,
+            ),
+        )
+        return obj
+
     async def add_annotation_tasks(
         self,
         session: AsyncSession,
@@ -169,10 +198,11 @@ class EvaluationSetAPI(
         tag: schemas.Tag,
     ) -> schemas.EvaluationSet:
         """Add a tag to an annotation project."""
-        if tag in obj.tags:
-            raise ValueError(
-                f"Annotation project {obj.id} already has tag {tag.id}."
-            )
+        for t in obj.tags:
+            if t.id == tag.id:
+                raise ValueError(
+                    f"Annotation project {obj.id} already has tag {tag.id}."
+                )
 
         await create_object(
             session,
@@ -185,6 +215,39 @@ class EvaluationSetAPI(
         self._update_cache(obj)
         return obj
 
+    async def add_tags(
+        self,
+        session: AsyncSession,
+        obj: schemas.EvaluationSet,
+        evaluation_tags: Sequence[schemas.Tag],
+    ) -> schemas.EvaluationSet:
+        """Add multiple tags to an evaluation set.
+
+        Tags that are already in the evaluation set are skipped.
+        """
+        existing = {t.id for t in obj.tags}
+        new_tags = []
+        for tag in evaluation_tags:
+            if tag.id not in existing:
+                existing.add(tag.id)
+                new_tags.append(tag)
+
+        if not new_tags:
+            return obj
+
+        await create_objects(
+            session,
+            models.EvaluationSetTag,
+            [
+                dict(evaluation_set_id=obj.id, tag_id=tag.id)
+                for tag in new_tags
+            ],
+        )
+
+        obj = obj.model_copy(update=dict(tags=[*obj.tags, *new_tags]))
+        self._update_cache(obj)
+        return obj
+
     async def remove_tag(
         self,
         session: AsyncSession,
@@ -192,7 +255,7 @@ class EvaluationSetAPI(
         tag: schemas.Tag,
     ) -> schemas.EvaluationSet:
         """Remove a tag from an annotation project."""
-        if tag not in obj.tags:
+        if all(t.id != tag.id for t in obj.tags):
             raise ValueError(
                 f"Annotation project {obj.id} does not have tag {tag.id}."
             )
@@ -349,13 +412,11 @@ class EvaluationSetAPI(
         self, session: AsyncSession, data: data.EvaluationSet
     ) -> schemas.EvaluationSet:
         """Create an evaluation set from an object in `soundevent` format."""
+        # NOTE: Both get and create already update the cache.
         try:
-            obj = await self.get(session, data.uuid)
+            return await self.get(session, data.uuid)
         except exceptions.NotFoundError:
-            obj = await self._create_from_soundevent(session, data)
-
-        self._update_cache(obj)
-        return obj
+            return await self._create_from_soundevent(session, data)
 
     async def to_soundevent(
         self,
@@ -404,17 +465,22 @@ class EvaluationSetAPI(
         data: data.EvaluationSet,
     ) -> schemas.EvaluationSet:
         """Update an evaluation set from an object in `soundevent` format."""
+        # NOTE: The tags and annotations are resolved one at a time, as the
+        # session cannot run queries concurrently, but they are linked to
+        # the evaluation set with one bulk insert each.
         _existing_tags = {(t.key, t.value) for t in obj.tags}
-        for t in data.evaluation_tags:
-            if (t.key, t.value) not in _existing_tags:
-                tag = await tags.from_soundevent(session, t)
-                obj = await self.add_tag(session, obj, tag)
-
-        for a in data.clip_annotations:
-            ann = await clip_annotations.from_soundevent(session, a)
-            obj = await self.add_clip_annotation(session, obj, ann)
-
-        return obj
+        new_tags = [
+            await tags.from_soundevent(session, t)
+            for t in data.evaluation_tags
+            if (t.key, t.value) not in _existing_tags
+        ]
+        obj = await self.add_tags(session, obj, new_tags)
+
+        anns = [
+            await clip_annotations.from_soundevent(session, a)
+            for a in data.clip_annotations
+        ]
+        return await self.add_clip_annotations(session, obj, anns)
 
 
 evaluation_sets = EvaluationSetAPI()
@@ -27,7 +27,6 @@ async def get_mapping(
     if not uuids:
         return {}
 
-    values = [str(uuid) for uuid in uuids]
-    stmt = select(model.id, model.uuid).where(model.uuid.in_(values))  # type: ignore
+    stmt = select(model.id, model.uuid).where(model.uuid.in_(uuids))  # type: ignore
     result = await session.execute(stmt)
     return {r[1]: r[0] for r in result.all()}
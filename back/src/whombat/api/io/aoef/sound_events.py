@@ -14,6 +14,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from whombat import models
 from whombat.api import common
 from whombat.api.io.aoef.common import get_mapping
+from whombat.api.sound_events import get_geometry_bounds
 
 
 async def get_sound_events(
@@ -62,6 +63,7 @@ async def import_sound_events(
             "recording_id": recordings[sound_events.recording],
             "geometry_type": sound_events.geometry.type,
             "geometry": sound_events.geometry,
+            **get_geometry_bounds(sound_events.geometry),
         }
         for sound_events in sound_events
         # Do not import sound events without geometry
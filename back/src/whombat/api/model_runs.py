@@ -5,12 +5,16 @@ from typing import Sequence
 from uuid import UUID
 
 from soundevent import data
-from sqlalchemy import select
+from sqlalchemy import select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from whombat import exceptions, models, schemas
 from whombat.api.clip_predictions import clip_predictions
-from whombat.api.common import BaseAPI, create_object
+from whombat.api.common import (
+    BaseAPI,
+    create_objects_without_duplicates,
+    insert_object,
+)
 from whombat.filters.base import Filter
 from whombat.filters.clip_predictions import ModelRunFilter
 
@@ -97,7 +101,7 @@ class ModelRunAPI(
         raise_if_exists: bool = False,
     ) -> schemas.ModelRun:
         try:
-            await create_object(
+            await insert_object(
                 session,
                 models.ModelRunPrediction,
                 model_run_id=obj.id,
@@ -108,19 +112,60 @@ class ModelRunAPI(
                 raise err
         return obj
 
+    async def add_clip_predictions(
+        self,
+        session: AsyncSession,
+        obj: schemas.ModelRun,
+        predictions: Sequence[schemas.ClipPrediction],
+    ) -> schemas.ModelRun:
+        """Add multiple clip predictions to a model run.
+
+        Clip predictions that are already in the model run are skipped.
+        """
+        await create_objects_without_duplicates(
+            session,
+            model=models.ModelRunPrediction,
+            data=[
+                dict(
+                    model_run_id=obj.id,
+                    clip_prediction_id=prediction.id,
+                )
+                for prediction in predictions
+            ],
+            key=lambda x: (x["model_run_id"], x["clip_prediction_id"]),
+            key_column=tuple_(
+                models.ModelRunPrediction.model_run_id,
+                models.ModelRunPrediction.clip_prediction_id,
+            ),
+        )
+        return obj
+
     async def update_from_soundevent(
         self,
         session: AsyncSession,
         obj: schemas.ModelRun,
         data: data.ModelRun,
     ) -> schemas.ModelRun:
+        # NOTE: The clip predictions are resolved one at a time, as the
+        # session cannot run queries concurrently, but they are linked to
+        # the model run with one bulk insert. Repeated clip predictions are
+        # only resolved once.
+        predictions: dict[UUID, schemas.ClipPrediction] = {}
         for clip_prediction in data.clip_predictions:
+            if clip_prediction.uuid in predictions:
+                continue
+
             prediction = await clip_predictions.from_soundevent(
                 session,
                 clip_prediction,
             )
-            obj = await self.add_clip_prediction(session, obj, prediction)
-        return obj
+            predictions[clip_prediction.uuid] = prediction
+
+        return await self.add_clip_predictions(
+            session,
+            obj,
+            list(predictions.values()),
+        )
 
     async def from_soundevent(
         self, session: AsyncSession, data: data.ModelRun
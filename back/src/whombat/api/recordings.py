@@ -11,7 +11,7 @@ from uuid import UUID
 import cachetools
 import soundfile as sf
 from soundevent import data
-from soundevent.audio import MediaInfo, compute_md5_checksum, get_media_info
+from soundevent.audio import MediaInfo, get_media_info
 from sqlalchemy import and_
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -306,7 +306,7 @@ class RecordingAPI(
             audio_dir = get_settings().audio_dir
 
         if data.path is not None:
-            new_hash = compute_md5_checksum(data.path)
+            new_hash = files.compute_hash(data.path)
 
             if new_hash != obj.hash:
                 raise ValueError(
@@ -397,7 +397,7 @@ class RecordingAPI(
                     f"Recording already has a note with UUID {note.uuid}"
                 )
 
-        await common.create_object(
+        await common.insert_object(
             session,
             models.RecordingNote,
             recording_id=obj.id,
@@ -430,12 +430,13 @@ class RecordingAPI(
         recording : schemas.recordings.Recording
             The updated recording.
         """
-        if tag in obj.tags:
-            raise exceptions.DuplicateObjectError(
-                f"Recording already has the tag {tag}"
-            )
+        for t in obj.tags:
+            if t.id == tag.id:
+                raise exceptions.DuplicateObjectError(
+                    f"Recording already has the tag {tag}"
+                )
 
-        await common.create_object(
+        await common.insert_object(
             session,
             models.RecordingTag,
             recording_id=obj.id,
@@ -479,7 +480,7 @@ class RecordingAPI(
             feature.name,
         )
 
-        await common.create_object(
+        await common.insert_object(
             session,
             models.RecordingFeature,
             recording_id=obj.id,
@@ -519,7 +520,7 @@ class RecordingAPI(
                     f"Recording already has an owner with ID {owner.id}"
                 )
 
-        await common.create_object(
+        await common.insert_object(
             session,
             models.RecordingOwner,
             recording_id=obj.id,
@@ -650,7 +651,7 @@ class RecordingAPI(
         recording : schemas.recordings.Recording
             The updated recording.
         """
-        if tag not in obj.tags:
+        if all(t.id != tag.id for t in obj.tags):
             raise exceptions.NotFoundError(
                 f"Recording does not have the tag {tag}"
             )
@@ -665,7 +666,7 @@ class RecordingAPI(
         )
 
         obj = obj.model_copy(
-            update=dict(tags=[t for t in obj.tags if t != tag])
+            update=dict(tags=[t for t in obj.tags if t.id != tag.id])
         )
         self._update_cache(obj)
         return obj
@@ -937,6 +938,15 @@ def _assemble_recording_data(
     """Get missing recording data from file."""
     logger.debug(f"Assembling recording data from file: {data.path}")
 
+    # NOTE: Check this before reading the file, so that files outside the
+    # audio directory are not hashed only to be skipped.
+    if not data.path.is_relative_to(audio_dir):
+        logger.warning(
+            f"File is not in audio directory. {data.path} Skipping file."
+            f"Root audio directory: {audio_dir}",
+        )
+        return None
+
     try:
         info = files.get_file_info(data.path)
     except (ValueError, KeyError, sf.LibsndfileError) as e:
@@ -959,13 +969,6 @@ def _assemble_recording_data(
         )
         return None
 
-    if not data.path.is_relative_to(audio_dir):
-        logger.warning(
-            f"File is not in audio directory. {data.path} Skipping file."
-            f"Root audio directory: {audio_dir}",
-        )
-        return None
-
     if info.hash is None:
         logger.warning(
             f"Could not compute hash of file. {data.path} Skipping file."
@@ -1,6 +1,7 @@
 """Python API for interacting with Predictions."""
 
 from pathlib import Path
+from typing import Sequence
 from uuid import UUID
 
 from soundevent import data
@@ -94,28 +95,65 @@ class SoundEventPredictionAPI(
             Updated sound event prediction.
         """
         for t in obj.tags:
-            if (t.tag.key, t.tag.value) == (tag.key, tag.value):
+            if t.tag.id == tag.id:
                 raise exceptions.DuplicateObjectError(
                     f"Tag {tag} already exists in sound event "
                     f"prediction {obj.id}"
                 )
 
-        db_tag = await common.create_object(
+        predicted_tag = schemas.SoundEventPredictionTag(tag=tag, score=score)
+        await common.insert_object(
             session,
             models.SoundEventPredictionTag,
             sound_event_prediction_id=obj.id,
             tag_id=tag.id,
             score=score,
+            created_on=predicted_tag.created_on,
         )
 
-        obj = obj.model_copy(
-            update=dict(
-                tags=[
-                    *obj.tags,
-                    schemas.SoundEventPredictionTag.model_validate(db_tag),
-                ]
-            )
+        obj = obj.model_copy(update=dict(tags=[*obj.tags, predicted_tag]))
+        self._update_cache(obj)
+        return obj
+
+    async def add_tags(
+        self,
+        session: AsyncSession,
+        obj: schemas.SoundEventPrediction,
+        predicted_tags: Sequence[tuple[schemas.Tag, float]],
+    ) -> schemas.SoundEventPrediction:
+        """Add multiple tags to a sound event prediction at once.
+
+        Tags that the prediction already has are skipped. If a tag is
+        repeated, only its first score is kept.
+
+        Parameters
+        ----------
+        session
+            SQLAlchemy database session.
+        obj
+            Sound event prediction to add the tags to.
+        predicted_tags
+            Pairs of tag and confidence score to add.
+
+        Returns
+        -------
+        sound_event_prediction : schemas.SoundEventPrediction
+            Updated sound event prediction.
+        """
+        new_tags = await common.add_predicted_tags(
+            session,
+            models.SoundEventPredictionTag,
+            obj.tags,
+            [
+                schemas.SoundEventPredictionTag(tag=tag, score=score)
+                for tag, score in predicted_tags
+            ],
+            sound_event_prediction_id=obj.id,
         )
+        if not new_tags:
+            return obj
+
+        obj = obj.model_copy(update=dict(tags=[*obj.tags, *new_tags]))
         self._update_cache(obj)
         return obj
 
@@ -203,22 +241,15 @@ class SoundEventPredictionAPI(
                 clip_prediction,
             )
 
-        existing_tags = {(t.tag.key, t.tag.value) for t in prediction.tags}
-        for predicted_tag in data.tags:
-            if (
-                predicted_tag.tag.key,
-                predicted_tag.tag.value,
-            ) in existing_tags:
-                continue
-            tag = await tags.from_soundevent(session, predicted_tag.tag)
-            prediction = await self.add_tag(
-                session,
-                prediction,
-                tag,
-                predicted_tag.score,
-            )
-
-        return prediction
+        db_tags = await tags.from_soundevent_many(
+            session,
+            [predicted_tag.tag for predicted_tag in data.tags],
+        )
+        predicted_tags = [
+            (tag, predicted_tag.score)
+            for tag, predicted_tag in zip(db_tags, data.tags, strict=True)
+        ]
+        return await self.add_tags(session, prediction, predicted_tags)
 
     async def to_soundevent(
         self,
@@ -5,7 +5,7 @@ from typing import Sequence
 from uuid import UUID
 
 from soundevent import data
-from soundevent.geometry import compute_geometric_features
+from soundevent.geometry import compute_bounds, compute_geometric_features
 from sqlalchemy import and_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -17,6 +17,7 @@ from whombat.api.recordings import recordings
 
 __all__ = [
     "SoundEventAPI",
+    "get_geometry_bounds",
     "sound_events",
 ]
 
@@ -64,6 +65,7 @@ class SoundEventAPI(
             geometry=geometry,
             geometry_type=geometry.type,
             recording_id=recording.id,
+            **get_geometry_bounds(geometry),
             **kwargs,
         )
         await self.create_geometric_features(session, [sound_event])
@@ -97,7 +99,16 @@ class SoundEventAPI(
         exceptions.NotFoundError
             If the sound event does not exist in the database.
         """
-        obj = await super().update(session, obj, data)
+        updated = await common.update_object(
+            session,
+            self._model,
+            self._get_pk_condition(obj.uuid),
+            data,
+            geometry_type=data.geometry.type,
+            **get_geometry_bounds(data.geometry),
+        )
+        obj = self._schema.model_validate(updated)
+        self._update_cache(obj)
         return await self.update_geometric_features(session, obj)
 
     async def add_feature(
@@ -456,4 +467,27 @@ class SoundEventAPI(
         return self._model.uuid
 
 
+def get_geometry_bounds(geometry: data.Geometry) -> dict[str, float]:
+    """Compute the time and frequency bounds of a geometry.
+
+    Parameters
+    ----------
+    geometry
+        The geometry of the sound event.
+
+    Returns
+    -------
+    dict[str, float]
+        The `time_start`, `time_end`, `freq_low` and `freq_high` values
+        to store alongside the geometry.
+    """
+    time_start, freq_low, time_end, freq_high = compute_bounds(geometry)
+    return dict(
+        time_start=time_start,
+        time_end=time_end,
+        freq_low=freq_low,
+        freq_high=freq_high,
+    )
+
+
 sound_events = SoundEventAPI()
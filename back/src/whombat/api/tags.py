@@ -1,8 +1,10 @@
 """API functions to interact with tags."""
 
+from functools import lru_cache
 from typing import Any, Sequence
 
 from soundevent import data
+from soundevent.terms import get_term
 from sqlalchemy import and_, desc, func, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
@@ -18,6 +20,25 @@ __all__ = [
 ]
 
 
+def _term_from_key(key: str) -> data.Term:
+    """Get the term for a tag key.
+
+    Same as `data.term_from_key`, but keys with no registered term share a
+    single placeholder term, as exports convert the same few keys many
+    times over. The registry itself is checked on every call, so terms
+    registered later are picked up.
+    """
+    term = get_term(key)
+    if term is not None:
+        return term
+    return _unknown_term(key)
+
+
+@lru_cache(maxsize=1024)
+def _unknown_term(key: str) -> data.Term:
+    return data.Term(label=key, name=key, definition="Unknown")
+
+
 class TagAPI(
     common.BaseAPI[
         tuple[str, str],
@@ -29,6 +50,7 @@ class TagAPI(
 ):
     _model = models.Tag
     _schema = schemas.Tag
+    _flat_schema = True
 
     async def create(
         self,
@@ -116,6 +138,39 @@ class TagAPI(
             value=tag.value,
         )
 
+    async def from_soundevent_many(
+        self,
+        session: AsyncSession,
+        tags: Sequence[data.Tag],
+    ) -> list[schemas.Tag]:
+        """Get or create the tags of many soundevent Tag objects at once.
+
+        All tags are looked up, and the missing ones created, in bulk, so
+        each distinct tag is only resolved once however often it repeats.
+
+        Parameters
+        ----------
+        session
+            The database session.
+        tags
+            The soundevent tag objects.
+
+        Returns
+        -------
+        list[schemas.Tag]
+            The tags, in the order of `tags`.
+        """
+        if not tags:
+            return []
+
+        db_tags = await self.create_many_without_duplicates(
+            session,
+            [dict(key=tag.key, value=tag.value) for tag in tags],
+            return_all=True,
+        )
+        tags_by_key = {(tag.key, tag.value): tag for tag in db_tags}
+        return [tags_by_key[(tag.key, tag.value)] for tag in tags]
+
     def to_soundevent(
         self,
         tag: schemas.Tag,
@@ -133,7 +188,7 @@ class TagAPI(
             The soundevent tag object.
         """
         return data.Tag(
-            term=data.term_from_key(tag.key),
+            term=_term_from_key(tag.key),
             value=tag.value,
         )
 
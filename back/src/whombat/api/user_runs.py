@@ -3,11 +3,17 @@ from typing import Sequence
 from uuid import UUID
 
 from soundevent import data
+from sqlalchemy import tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql._typing import _ColumnExpressionArgument
 
 from whombat import exceptions, models, schemas
 from whombat.api.clip_predictions import clip_predictions
-from whombat.api.common import BaseAPI, create_object
+from whombat.api.common import (
+    BaseAPI,
+    create_objects_without_duplicates,
+    insert_object,
+)
 from whombat.filters.base import Filter
 from whombat.filters.clip_predictions import UserRunFilter
 
@@ -82,7 +88,7 @@ class UserRunAPI(
         raise_if_exists: bool = False,
     ) -> schemas.UserRun:
         try:
-            await create_object(
+            await insert_object(
                 session,
                 models.UserRunPrediction,
                 user_run_id=obj.id,
@@ -93,19 +99,60 @@ class UserRunAPI(
                 raise err
         return obj
 
+    async def add_clip_predictions(
+        self,
+        session: AsyncSession,
+        obj: schemas.UserRun,
+        predictions: Sequence[schemas.ClipPrediction],
+    ) -> schemas.UserRun:
+        """Add multiple clip predictions to a user run.
+
+        Clip predictions that are already in the user run are skipped.
+        """
+        await create_objects_without_duplicates(
+            session,
+            model=models.UserRunPrediction,
+            data=[
+                dict(
+                    user_run_id=obj.id,
+                    clip_prediction_id=prediction.id,
+                )
+                for prediction in predictions
+            ],
+            key=lambda x: (x["user_run_id"], x["clip_prediction_id"]),
+            key_column=tuple_(
+                models.UserRunPrediction.user_run_id,
+                models.UserRunPrediction.clip_prediction_id,
+            ),
+        )
+        return obj
+
     async def update_from_soundevent(
         self,
         session: AsyncSession,
         obj: schemas.UserRun,
         data: data.PredictionSet,
     ) -> schemas.UserRun:
+        # NOTE: The clip predictions are resolved one at a time, as the
+        # session cannot run queries concurrently, but they are linked to
+        # the user run with one bulk insert. Repeated clip predictions are
+        # only resolved once.
+        predictions: dict[UUID, schemas.ClipPrediction] = {}
         for clip_prediction in data.clip_predictions:
+            if clip_prediction.uuid in predictions:
+                continue
+
             prediction = await clip_predictions.from_soundevent(
                 session,
                 clip_prediction,
             )
-            obj = await self.add_clip_prediction(session, obj, prediction)
-        return obj
+            predictions[clip_prediction.uuid] = prediction
+
+        return await self.add_clip_predictions(
+            session,
+            obj,
+            list(predictions.values()),
+        )
 
     async def from_soundevent(
         self,
@@ -129,21 +176,47 @@ class UserRunAPI(
         session: AsyncSession,
         obj: schemas.UserRun,
         audio_dir: Path | None = None,
+        batch_size: int = 1000,
     ) -> data.PredictionSet:
-        predictions, _ = await self.get_clip_predictions(
-            session, obj, limit=-1
-        )
+        # NOTE: The clip predictions are loaded and converted in batches,
+        # so only one batch of database objects is held in memory at a
+        # time. Pages are keyed on the last id seen rather than an offset,
+        # so no page rescans the rows before it.
+        exported = []
+        last_id = None
+        while True:
+            filters: list[Filter | _ColumnExpressionArgument] = [
+                UserRunFilter(eq=obj.uuid)
+            ]
+            if last_id is not None:
+                filters.append(models.ClipPrediction.id > last_id)
+
+            predictions, _ = await clip_predictions.get_many(
+                session,
+                limit=batch_size,
+                offset=None,
+                filters=filters,
+                sort_by=models.ClipPrediction.id,
+                with_count=False,
+            )
+            exported.extend(
+                [
+                    await clip_predictions.to_soundevent(
+                        session,
+                        cp,
+                        audio_dir=audio_dir,
+                    )
+                    for cp in predictions
+                ]
+            )
+            if len(predictions) < batch_size:
+                break
+            last_id = predictions[-1].id
+
         return data.PredictionSet(
             uuid=obj.uuid,
             created_on=obj.created_on,
-            clip_predictions=[
-                await clip_predictions.to_soundevent(
-                    session,
-                    cp,
-                    audio_dir=audio_dir,
-                )
-                for cp in predictions
-            ],
+            clip_predictions=exported,
         )
 
 
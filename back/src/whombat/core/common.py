@@ -1,16 +1,39 @@
 """Common functions for Whombat."""
 
-from collections.abc import Callable
+import sys
+from collections.abc import Callable, Iterable, Iterator
+from itertools import islice
 from typing import Hashable, TypeVar
 
 A = TypeVar("A")
 
 
 __all__ = [
+    "batched",
     "remove_duplicates",
 ]
 
 
+# NOTE: The version check is done once at import time so that callers get
+# the C implementation of `itertools.batched` directly whenever it exists.
+if sys.version_info >= (3, 12):
+    from itertools import batched
+else:
+
+    def batched(iterable: Iterable[A], n: int) -> Iterator[tuple[A, ...]]:
+        """Batch data from the iterable into tuples of length n.
+
+        Fallback for `itertools.batched`, which was added in Python 3.12.
+        The last batch may be shorter than n.
+        """
+        if n < 1:
+            raise ValueError("n must be at least one")
+
+        iterator = iter(iterable)
+        while batch := tuple(islice(iterator, n)):
+            yield batch
+
+
 def remove_duplicates(
     objects: list[A],
     key: Callable[[A], Hashable] = lambda x: x,
@@ -1,12 +1,14 @@
 """File handling functions."""
 
+import hashlib
 import logging
+import mmap
 from dataclasses import dataclass
 from pathlib import Path
 
+import soundfile as sf
 from soundevent.audio import (
     MediaInfo,
-    compute_md5_checksum,
     get_media_info,
     is_audio_file,
 )
@@ -14,6 +16,7 @@ from soundevent.audio import (
 logger = logging.getLogger(__name__)
 
 __all__ = [
+    "compute_hash",
     "get_audio_files_in_folder",
     "get_file_info",
     "FileInfo",
@@ -46,6 +49,39 @@ def get_audio_files_in_folder(
     ]
 
 
+def compute_hash(path: Path) -> str:
+    """Compute the hash used to identify a recording file.
+
+    The hash is the MD5 checksum of the file, identical to the one
+    computed by `soundevent.audio.compute_md5_checksum`. It must not
+    change, as hashes are stored in AOEF files and used to match
+    recordings across installations.
+
+    The file is memory-mapped and hashed in a single call, which avoids
+    copying it through Python buffers and lets `hashlib` release the GIL
+    while hashing, so several files can be hashed concurrently in threads.
+
+    Parameters
+    ----------
+    path: Path
+        Path to the file.
+
+    Returns
+    -------
+    hash: str
+        The hexadecimal digest of the file.
+    """
+    with open(path, "rb") as fp:
+        try:
+            with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return hashlib.md5(mm).hexdigest()
+        except (ValueError, OSError):
+            # NOTE: Empty files and some file systems cannot be memory-mapped.
+            # Fall back to streaming, which reads in 256 KiB chunks.
+            fp.seek(0)
+            return hashlib.file_digest(fp, "md5").hexdigest()
+
+
 @dataclass
 class FileInfo:
     path: Path
@@ -62,11 +98,12 @@ def get_file_info(path: Path) -> FileInfo:
 
     - If the file exists.
     - If the file is an audio file.
-    - The SHA256 hash of the file.
+    - The hash of the file (see `compute_hash`).
     - Information about the media file (duration, samplerate, etc).
 
     The hash and media information will only be computed if the file exists and
-    is an audio file.
+    is an audio file. The hash is skipped if the media information cannot be
+    read.
 
     Parameters
     ----------
@@ -88,17 +125,19 @@ def get_file_info(path: Path) -> FileInfo:
         logger.warning(f"File is not an audio file: {path}")
         return FileInfo(path=path, exists=True, is_audio=False)
 
-    logger.debug(f"Computing hash of file: {path}")
-    hash = compute_md5_checksum(path)
-    logger.debug("done")
-
+    # NOTE: Reading the media info only parses the file header, so it is
+    # done first to reject unreadable files without hashing all of them.
     try:
         logger.debug(f"Getting media info of file: {path}")
         media_info = get_media_info(path)
         logger.debug("done")
-    except ValueError:
+    except (ValueError, sf.LibsndfileError):
         logger.warning(f"Could not get media info of file: {path}")
-        media_info = None
+        return FileInfo(path=path, exists=True, is_audio=True)
+
+    logger.debug(f"Computing hash of file: {path}")
+    hash = compute_hash(path)
+    logger.debug("done")
 
     logger.debug(f"Finished getting information about file: {path}")
     return FileInfo(
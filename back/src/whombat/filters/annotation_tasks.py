@@ -3,7 +3,7 @@
 from uuid import UUID
 
 from soundevent import data
-from sqlalchemy import Select, or_
+from sqlalchemy import Select, or_, select
 
 from whombat import models
 from whombat.filters import base
@@ -205,6 +205,12 @@ class DatasetFilter(base.Filter):
         if not self.eq:
             return query
 
+        dataset_id = (
+            select(models.Dataset.id)
+            .where(models.Dataset.uuid == self.eq)
+            .scalar_subquery()
+        )
+
         return (
             query.join(
                 models.Clip,
@@ -218,11 +224,7 @@ class DatasetFilter(base.Filter):
                 models.DatasetRecording,
                 models.DatasetRecording.recording_id == models.Recording.id,
             )
-            .join(
-                models.Dataset,
-                models.Dataset.id == models.DatasetRecording.dataset_id,
-            )
-            .where(models.Dataset.uuid == self.eq)
+            .where(models.DatasetRecording.dataset_id == dataset_id)
         )
 
 
@@ -2,7 +2,7 @@
 
 from uuid import UUID
 
-from sqlalchemy import Select
+from sqlalchemy import Select, select
 
 from whombat import models
 from whombat.filters import base
@@ -168,6 +168,12 @@ class DatasetFilter(base.Filter):
         if self.eq is None:
             return query
 
+        dataset_id = (
+            select(models.Dataset.id)
+            .where(models.Dataset.uuid == self.eq)
+            .scalar_subquery()
+        )
+
         return (
             query.join(
                 models.RecordingNote,
@@ -181,11 +187,7 @@ class DatasetFilter(base.Filter):
                 models.DatasetRecording,
                 models.DatasetRecording.recording_id == models.Recording.id,
             )
-            .join(
-                models.Dataset,
-                models.Dataset.id == models.DatasetRecording.dataset_id,
-            )
-            .where(models.Dataset.uuid == self.eq)
+            .where(models.DatasetRecording.dataset_id == dataset_id)
         )
 
 
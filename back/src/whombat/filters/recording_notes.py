@@ -1,6 +1,6 @@
 """Filters for Recording Notes."""
 
-from sqlalchemy import Select
+from sqlalchemy import Select, select
 
 from whombat import models
 from whombat.filters import base
@@ -78,6 +78,12 @@ class DatasetFilter(base.UUIDFilter):
         if not self.eq:
             return query
 
+        dataset_id = (
+            select(models.Dataset.id)
+            .where(models.Dataset.uuid == self.eq)
+            .scalar_subquery()
+        )
+
         return (
             query.join(
                 models.Recording,
@@ -87,11 +93,7 @@ class DatasetFilter(base.UUIDFilter):
                 models.DatasetRecording,
                 models.Recording.id == models.DatasetRecording.recording_id,
             )
-            .join(
-                models.Dataset,
-                models.DatasetRecording.dataset_id == models.Dataset.id,
-            )
-            .where(models.Dataset.uuid == self.eq)
+            .where(models.DatasetRecording.dataset_id == dataset_id)
         )
 
 
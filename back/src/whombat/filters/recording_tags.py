@@ -2,7 +2,7 @@
 
 from uuid import UUID
 
-from sqlalchemy import Select
+from sqlalchemy import Select, select
 
 from whombat import models
 from whombat.filters import base
@@ -25,6 +25,12 @@ class DatasetFilter(base.Filter):
         if not self.eq:
             return query
 
+        dataset_id = (
+            select(models.Dataset.id)
+            .where(models.Dataset.uuid == self.eq)
+            .scalar_subquery()
+        )
+
         return (
             query.join(
                 models.Recording,
@@ -34,11 +40,7 @@ class DatasetFilter(base.Filter):
                 models.DatasetRecording,
                 models.Recording.id == models.DatasetRecording.recording_id,
             )
-            .join(
-                models.Dataset,
-                models.DatasetRecording.dataset_id == models.Dataset.id,
-            )
-            .where(models.Dataset.uuid == self.eq)
+            .where(models.DatasetRecording.dataset_id == dataset_id)
         )
 
 
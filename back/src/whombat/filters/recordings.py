@@ -70,18 +70,17 @@ class DatasetFilter(base.Filter):
         if not self.eq:
             return query
 
-        return (
-            query.join(
-                models.DatasetRecording,
-                models.Recording.id == models.DatasetRecording.recording_id,
-            )
-            .join(
-                models.Dataset,
-                models.DatasetRecording.dataset_id == models.Dataset.id,
-            )
+        dataset_id = (
+            select(models.Dataset.id)
             .where(models.Dataset.uuid == self.eq)
+            .scalar_subquery()
         )
 
+        return query.join(
+            models.DatasetRecording,
+            models.Recording.id == models.DatasetRecording.recording_id,
+        ).where(models.DatasetRecording.dataset_id == dataset_id)
+
 
 class IssuesFilter(base.Filter):
     """Filter recordings by their status.
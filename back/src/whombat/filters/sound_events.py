@@ -2,6 +2,7 @@
 
 from uuid import UUID
 
+from soundevent.data.geometries import GeometryType
 from sqlalchemy import Select
 
 from whombat import models
@@ -11,6 +12,10 @@ __all__ = [
     "SoundEventFilter",
     "RecordingFilter",
     "GeometryTypeFilter",
+    "TimeStartFilter",
+    "TimeEndFilter",
+    "FreqLowFilter",
+    "FreqHighFilter",
     "CreatedOnFilter",
     "UUIDFilter",
 ]
@@ -30,8 +35,31 @@ class RecordingFilter(base.Filter):
         ).filter(models.Recording.uuid == self.eq)
 
 
-GeometryTypeFilter = base.string_filter(models.SoundEvent.geometry_type)
-"""Filter by geometry type."""
+class GeometryTypeFilter(base.Filter):
+    eq: GeometryType | None = None
+
+    def filter(self, query: Select) -> Select:
+        """Filter by geometry type."""
+        if self.eq is None:
+            return query
+
+        return query.where(models.SoundEvent.geometry_type == self.eq)
+
+
+TimeStartFilter = base.optional_float_filter(models.SoundEvent.time_start)
+"""Filter by the start time of the sound event."""
+
+
+TimeEndFilter = base.optional_float_filter(models.SoundEvent.time_end)
+"""Filter by the end time of the sound event."""
+
+
+FreqLowFilter = base.optional_float_filter(models.SoundEvent.freq_low)
+"""Filter by the lowest frequency of the sound event."""
+
+
+FreqHighFilter = base.optional_float_filter(models.SoundEvent.freq_high)
+"""Filter by the highest frequency of the sound event."""
 
 
 CreatedOnFilter = base.date_filter(models.SoundEvent.created_on)
@@ -73,6 +101,10 @@ class FeatureFilter(base.Filter):
 SoundEventFilter = base.combine(
     recording=RecordingFilter,
     geometry_type=GeometryTypeFilter,
+    time_start=TimeStartFilter,
+    time_end=TimeEndFilter,
+    freq_low=FreqLowFilter,
+    freq_high=FreqHighFilter,
     created_on=CreatedOnFilter,
     uuid=UUIDFilter,
     feature=FeatureFilter,
@@ -224,6 +224,12 @@ class DatasetFilter(base.Filter):
         if self.eq is None:
             return query
 
+        dataset_id = (
+            select(models.Dataset.id)
+            .where(models.Dataset.uuid == self.eq)
+            .scalar_subquery()
+        )
+
         subquery = (
             select(models.Tag.id)
             .join(
@@ -238,11 +244,7 @@ class DatasetFilter(base.Filter):
                 models.DatasetRecording,
                 models.DatasetRecording.recording_id == models.Recording.id,
             )
-            .join(
-                models.Dataset,
-                models.Dataset.id == models.DatasetRecording.dataset_id,
-            )
-            .filter(models.Dataset.uuid == self.eq)
+            .filter(models.DatasetRecording.dataset_id == dataset_id)
         )
 
         return query.filter(models.Tag.id.in_(subquery))
@@ -0,0 +1,60 @@
+"""Use native UUID type for datasets and sound events.
+
+Revision ID: 279ae92d946c
+Revises: 654de1e40840
+Create Date: 2026-10-15 07:52:40.118326
+
+"""
+
+from typing import Sequence, Union
+
+import fastapi_users_db_sqlalchemy.generics
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "279ae92d946c"
+down_revision: Union[str, None] = "654de1e40840"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ["dataset", "sound_event"]
+
+
+def upgrade() -> None:
+    # NOTE: On PostgreSQL both types map to the native UUID column, so
+    # there is nothing to migrate.
+    if op.get_bind().dialect.name == "postgresql":
+        return
+
+    for table in TABLES:
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column(
+                "uuid",
+                existing_type=fastapi_users_db_sqlalchemy.generics.GUID(),
+                type_=sa.Uuid(as_uuid=True, native_uuid=True),
+                existing_nullable=False,
+            )
+
+        op.execute(f"UPDATE {table} SET uuid = lower(replace(uuid, '-', ''))")
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        return
+
+    for table in TABLES:
+        op.execute(
+            f"UPDATE {table} SET uuid = "
+            "substr(uuid, 1, 8) || '-' || substr(uuid, 9, 4) || '-' || "
+            "substr(uuid, 13, 4) || '-' || substr(uuid, 17, 4) || '-' || "
+            "substr(uuid, 21)"
+        )
+
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column(
+                "uuid",
+                existing_type=sa.Uuid(as_uuid=True, native_uuid=True),
+                type_=fastapi_users_db_sqlalchemy.generics.GUID(),
+                existing_nullable=False,
+            )
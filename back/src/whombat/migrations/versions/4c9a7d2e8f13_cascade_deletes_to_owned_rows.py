@@ -0,0 +1,170 @@
+"""Cascade deletes to owned rows.
+
+Revision ID: 4c9a7d2e8f13
+Revises: 7b3c5e1f9a20
+Create Date: 2026-10-15 14:12:53.418027
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "4c9a7d2e8f13"
+down_revision: Union[str, None] = "7b3c5e1f9a20"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# NOTE: Rows owned by the referred row are deleted with it, optional links
+# to owned rows are cleared instead. References to tags, feature names and
+# users are left without an action, so deleting one of those fails while it
+# is still in use rather than deleting the data that uses it. Each entry is
+# (column, referred table, ondelete).
+FOREIGN_KEYS: dict[str, list[tuple[str, str, str]]] = {
+    "annotation_project_tag": [
+        ("annotation_project_id", "annotation_project", "CASCADE"),
+    ],
+    "clip": [
+        ("recording_id", "recording", "CASCADE"),
+    ],
+    "evaluation_metric": [
+        ("evaluation_id", "evaluation", "CASCADE"),
+    ],
+    "evaluation_set_model_run": [
+        ("evaluation_set_id", "evaluation_set", "CASCADE"),
+        ("model_run_id", "model_run", "CASCADE"),
+    ],
+    "evaluation_set_tag": [
+        ("evaluation_set_id", "evaluation_set", "CASCADE"),
+    ],
+    "model_run_evaluation": [
+        ("evaluation_id", "evaluation", "CASCADE"),
+        ("evaluation_set_id", "evaluation_set", "CASCADE"),
+        ("model_run_id", "model_run", "CASCADE"),
+    ],
+    "recording_feature": [
+        ("recording_id", "recording", "CASCADE"),
+    ],
+    "recording_owner": [
+        ("recording_id", "recording", "CASCADE"),
+    ],
+    "recording_tag": [
+        ("recording_id", "recording", "CASCADE"),
+    ],
+    "clip_annotation": [
+        ("clip_id", "clip", "CASCADE"),
+    ],
+    "clip_feature": [
+        ("clip_id", "clip", "CASCADE"),
+    ],
+    "clip_prediction": [
+        ("clip_id", "clip", "CASCADE"),
+    ],
+    "evaluation_set_user_run": [
+        ("evaluation_set_id", "evaluation_set", "CASCADE"),
+        ("user_run_id", "user_run", "CASCADE"),
+    ],
+    "recording_note": [
+        ("note_id", "note", "CASCADE"),
+        ("recording_id", "recording", "CASCADE"),
+    ],
+    "user_run_evaluation": [
+        ("evaluation_id", "evaluation", "CASCADE"),
+        ("evaluation_set_id", "evaluation_set", "CASCADE"),
+        ("user_run_id", "user_run", "CASCADE"),
+    ],
+    "annotation_task": [
+        ("annotation_project_id", "annotation_project", "CASCADE"),
+        ("clip_annotation_id", "clip_annotation", "SET NULL"),
+        ("clip_id", "clip", "CASCADE"),
+    ],
+    "clip_annotation_note": [
+        ("clip_annotation_id", "clip_annotation", "CASCADE"),
+        ("note_id", "note", "CASCADE"),
+    ],
+    "clip_annotation_tag": [
+        ("clip_annotation_id", "clip_annotation", "CASCADE"),
+    ],
+    "clip_evaluation": [
+        ("clip_annotation_id", "clip_annotation", "CASCADE"),
+        ("clip_prediction_id", "clip_prediction", "CASCADE"),
+        ("evaluation_id", "evaluation", "CASCADE"),
+    ],
+    "clip_prediction_tag": [
+        ("clip_prediction_id", "clip_prediction", "CASCADE"),
+    ],
+    "evaluation_set_annotation": [
+        ("clip_annotation_id", "clip_annotation", "CASCADE"),
+        ("evaluation_set_id", "evaluation_set", "CASCADE"),
+    ],
+    "model_run_prediction": [
+        ("clip_prediction_id", "clip_prediction", "CASCADE"),
+        ("model_run_id", "model_run", "CASCADE"),
+    ],
+    "sound_event_annotation": [
+        ("clip_annotation_id", "clip_annotation", "CASCADE"),
+        ("sound_event_id", "sound_event", "CASCADE"),
+    ],
+    "sound_event_prediction": [
+        ("clip_prediction_id", "clip_prediction", "CASCADE"),
+        ("sound_event_id", "sound_event", "CASCADE"),
+    ],
+    "user_run_prediction": [
+        ("clip_prediction_id", "clip_prediction", "CASCADE"),
+        ("user_run_id", "user_run", "CASCADE"),
+    ],
+    "annotation_status_badge": [
+        ("annotation_task_id", "annotation_task", "CASCADE"),
+    ],
+    "clip_evaluation_metric": [
+        ("clip_evaluation_id", "clip_evaluation", "CASCADE"),
+    ],
+    "sound_event_annotation_note": [
+        ("note_id", "note", "CASCADE"),
+        ("sound_event_annotation_id", "sound_event_annotation", "CASCADE"),
+    ],
+    "sound_event_annotation_tag": [
+        ("sound_event_annotation_id", "sound_event_annotation", "CASCADE"),
+    ],
+    "sound_event_evaluation": [
+        ("clip_evaluation_id", "clip_evaluation", "CASCADE"),
+        ("source_id", "sound_event_prediction", "SET NULL"),
+        ("target_id", "sound_event_annotation", "SET NULL"),
+    ],
+    "sound_event_prediction_tag": [
+        ("sound_event_prediction_id", "sound_event_prediction", "CASCADE"),
+    ],
+    "sound_event_evaluation_metric": [
+        ("sound_event_evaluation_id", "sound_event_evaluation", "CASCADE"),
+    ],
+}
+
+
+def upgrade() -> None:
+    for table, foreign_keys in FOREIGN_KEYS.items():
+        with op.batch_alter_table(table) as batch_op:
+            for column, referred_table, ondelete in foreign_keys:
+                name = op.f(f"fk_{table}_{column}_{referred_table}")
+                batch_op.drop_constraint(name, type_="foreignkey")
+                batch_op.create_foreign_key(
+                    name,
+                    referred_table,
+                    [column],
+                    ["id"],
+                    ondelete=ondelete,
+                )
+
+
+def downgrade() -> None:
+    for table, foreign_keys in FOREIGN_KEYS.items():
+        with op.batch_alter_table(table) as batch_op:
+            for column, referred_table, _ in foreign_keys:
+                name = op.f(f"fk_{table}_{column}_{referred_table}")
+                batch_op.drop_constraint(name, type_="foreignkey")
+                batch_op.create_foreign_key(
+                    name,
+                    referred_table,
+                    [column],
+                    ["id"],
+                )
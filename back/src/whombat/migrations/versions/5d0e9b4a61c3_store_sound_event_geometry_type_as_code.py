@@ -0,0 +1,70 @@
+"""Store sound event geometry type as a small integer code.
+
+Revision ID: 5d0e9b4a61c3
+Revises: a3f1c8d2b7e4
+Create Date: 2026-10-15 09:41:53.208114
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5d0e9b4a61c3"
+down_revision: Union[str, None] = "a3f1c8d2b7e4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# NOTE: Copied from whombat.models.base.GEOMETRY_TYPE_CODES so that this
+# migration does not change if the model does.
+GEOMETRY_TYPE_CODES = {
+    "TimeStamp": 0,
+    "TimeInterval": 1,
+    "BoundingBox": 2,
+    "Point": 3,
+    "LineString": 4,
+    "Polygon": 5,
+    "MultiPoint": 6,
+    "MultiLineString": 7,
+    "MultiPolygon": 8,
+}
+
+
+def upgrade() -> None:
+    whens = " ".join(
+        f"WHEN '{name}' THEN '{code}'"
+        for name, code in GEOMETRY_TYPE_CODES.items()
+    )
+    op.execute(
+        f"UPDATE sound_event SET geometry_type = CASE geometry_type {whens} END"
+    )
+
+    with op.batch_alter_table("sound_event") as batch_op:
+        batch_op.alter_column(
+            "geometry_type",
+            existing_type=sa.String(),
+            type_=sa.SmallInteger(),
+            existing_nullable=False,
+            postgresql_using="geometry_type::smallint",
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("sound_event") as batch_op:
+        batch_op.alter_column(
+            "geometry_type",
+            existing_type=sa.SmallInteger(),
+            type_=sa.String(),
+            existing_nullable=False,
+            postgresql_using="geometry_type::text",
+        )
+
+    whens = " ".join(
+        f"WHEN '{code}' THEN '{name}'"
+        for name, code in GEOMETRY_TYPE_CODES.items()
+    )
+    op.execute(
+        f"UPDATE sound_event SET geometry_type = CASE geometry_type {whens} END"
+    )
@@ -0,0 +1,57 @@
+"""Store sound event geometry as native JSON.
+
+Revision ID: 654de1e40840
+Revises: 6c762964eda0
+Create Date: 2026-10-15 07:31:12.480913
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "654de1e40840"
+down_revision: Union[str, None] = "6c762964eda0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # NOTE: Geometries were already serialized as JSON strings, so the
+    # existing values can be reinterpreted without rewriting them.
+    with op.batch_alter_table("sound_event") as batch_op:
+        batch_op.alter_column(
+            "geometry",
+            existing_type=sa.String(),
+            type_=sa.JSON().with_variant(postgresql.JSONB(), "postgresql"),
+            existing_nullable=False,
+            postgresql_using="geometry::jsonb",
+        )
+
+    if op.get_bind().dialect.name == "postgresql":
+        op.create_index(
+            "ix_sound_event_geometry",
+            "sound_event",
+            ["geometry"],
+            unique=False,
+            postgresql_using="gin",
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        op.drop_index("ix_sound_event_geometry", table_name="sound_event")
+
+    with op.batch_alter_table("sound_event") as batch_op:
+        batch_op.alter_column(
+            "geometry",
+            existing_type=sa.JSON().with_variant(
+                postgresql.JSONB(), "postgresql"
+            ),
+            type_=sa.String(),
+            existing_nullable=False,
+            postgresql_using="geometry::text",
+        )
@@ -0,0 +1,76 @@
+"""Add time and frequency bounds to sound events.
+
+Revision ID: a3f1c8d2b7e4
+Revises: 2ee6519f1fa7
+Create Date: 2026-10-15 09:02:18.513407
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from soundevent import data
+from soundevent.geometry import compute_bounds
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "a3f1c8d2b7e4"
+down_revision: Union[str, None] = "2ee6519f1fa7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BOUNDS = ["time_start", "time_end", "freq_low", "freq_high"]
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("sound_event") as batch_op:
+        for column in BOUNDS:
+            batch_op.add_column(sa.Column(column, sa.Float(), nullable=True))
+        batch_op.create_index(
+            "ix_sound_event_recording_id_time",
+            ["recording_id", "time_start", "time_end"],
+            unique=False,
+        )
+
+    # Backfill the bounds of the existing sound events from their geometry.
+    sound_event = sa.table(
+        "sound_event",
+        sa.column("id", sa.Integer()),
+        sa.column(
+            "geometry",
+            sa.JSON().with_variant(postgresql.JSONB(), "postgresql"),
+        ),
+        *[sa.column(column, sa.Float()) for column in BOUNDS],
+    )
+    conn = op.get_bind()
+    rows = conn.execute(sa.select(sound_event.c.id, sound_event.c.geometry))
+    values = []
+    for id, geometry in rows:
+        time_start, freq_low, time_end, freq_high = compute_bounds(
+            data.geometry_validate(geometry, mode="dict")
+        )
+        values.append(
+            {
+                "_id": id,
+                "time_start": time_start,
+                "time_end": time_end,
+                "freq_low": freq_low,
+                "freq_high": freq_high,
+            }
+        )
+
+    if values:
+        conn.execute(
+            sound_event.update()
+            .where(sound_event.c.id == sa.bindparam("_id"))
+            .values({column: sa.bindparam(column) for column in BOUNDS}),
+            values,
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("sound_event") as batch_op:
+        batch_op.drop_index("ix_sound_event_recording_id_time")
+        for column in reversed(BOUNDS):
+            batch_op.drop_column(column)
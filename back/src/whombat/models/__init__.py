@@ -5,6 +5,15 @@ defined in separate files, and then imported into this module. This
 allows us to keep the models organized, and also allows us to import the
 models into other modules without having to import the entire database
 module.
+
+Foreign keys to an owning row declare what happens when it is deleted.
+Rows owned by it (features, tag and note links, annotations, predictions
+and so on) are deleted with it, while optional links to owned rows are
+set to null. The database applies these rules, so deleting a recording
+or a clip does not need to load everything that depends on it. Tags,
+feature names and users are shared rather than owned, so references to
+them, apart from access tokens and recording features, have no delete
+action and deleting one that is still in use fails.
 """
 
 from whombat.models.annotation_project import (
@@ -105,7 +105,7 @@ class AnnotationProjectTag(Base):
     )
 
     annotation_project_id: orm.Mapped[int] = orm.mapped_column(
-        ForeignKey("annotation_project.id"),
+        ForeignKey("annotation_project.id", ondelete="CASCADE"),
         nullable=False,
         primary_key=True,
     )
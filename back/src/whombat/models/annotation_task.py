@@ -51,19 +51,19 @@ class AnnotationTask(Base):
     """The database id of the task."""
 
     annotation_project_id: orm.Mapped[int] = orm.mapped_column(
-        ForeignKey("annotation_project.id"),
+        ForeignKey("annotation_project.id", ondelete="CASCADE"),
         nullable=False,
     )
     """The id of the project to which the task belongs."""
 
     clip_id: orm.Mapped[int] = orm.mapped_column(
-        ForeignKey("clip.id"),
+        ForeignKey("clip.id", ondelete="CASCADE"),
         nullable=False,
     )
     """The id of the clip to be annotated."""
 
     clip_annotation_id: orm.Mapped[int] = orm.mapped_column(
-        ForeignKey("clip_annotation.id"),
+        ForeignKey("clip_annotation.id", ondelete="SET NULL"),
         nullable=True,
     )
     """The id of the annotation created for the task."""
@@ -125,7 +125,7 @@ class AnnotationStatusBadge(Base):
     """The database id of the status badge."""
 
     annotation_task_id: orm.Mapped[int] = orm.mapped_column(
-        ForeignKey("annotation_task.id"),
+        ForeignKey("annotation_task.id", ondelete="CASCADE"),
         nullable=False,
     )
     """The id of the task to which the status badge belongs."""
@@ -6,17 +6,22 @@ All whombat models should inherit from this class.
 import datetime
 import uuid
 from pathlib import Path
+from typing import Annotated
 
 import sqlalchemy as sa
 import sqlalchemy.orm as orm
 import sqlalchemy.types as types
 from fastapi_users_db_sqlalchemy.generics import GUID
+from pydantic import Field, TypeAdapter
 from soundevent import data
 from sqlalchemy import MetaData
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.ext.asyncio import AsyncAttrs
 
 __all__ = [
     "Base",
+    "GEOMETRY_TYPE_CODES",
+    "GeometryTypeCode",
 ]
 
 
@@ -39,23 +44,89 @@ class PathType(types.TypeDecorator):
 
 
 class GeometryType(types.TypeDecorator):
-    """SqlAlchemy type for soundevent.Geometry objects."""
+    """SqlAlchemy type for soundevent.Geometry objects.
 
-    impl = types.String
+    Geometries are stored in a native JSON column (JSONB on PostgreSQL), so
+    the geometry can be indexed and queried on the database side.
+    """
+
+    impl = types.JSON
+
+    cache_ok = True
+
+    _adapter: TypeAdapter[data.Geometry] = TypeAdapter(
+        Annotated[data.Geometry, Field(discriminator="type")]
+    )
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(postgresql.JSONB())
+        return dialect.type_descriptor(types.JSON())
+
+    # NOTE: The JSON processing of the underlying type is bypassed so that
+    # pydantic serializes the JSON text itself, instead of going through an
+    # intermediate dictionary and the json module. On SQLite the stored text
+    # is also parsed directly by pydantic.
+    def bind_processor(self, dialect):
+        def process(value: data.Geometry | None) -> str | None:
+            if value is None:
+                return value
+            return value.model_dump_json()
+
+        return process
+
+    def result_processor(self, dialect, coltype):
+        def process(value: str | dict | None) -> data.Geometry | None:
+            if value is None:
+                return value
+
+            # NOTE: The PostgreSQL drivers decode JSON columns into Python
+            # objects themselves (SQLAlchemy registers a JSON codec for
+            # asyncpg), so only SQLite returns the JSON text.
+            if isinstance(value, dict):
+                return self._adapter.validate_python(value)
+
+            return self._adapter.validate_json(value)
+
+        return process
+
+
+GEOMETRY_TYPE_CODES: dict[str, int] = {
+    "TimeStamp": 0,
+    "TimeInterval": 1,
+    "BoundingBox": 2,
+    "Point": 3,
+    "LineString": 4,
+    "Polygon": 5,
+    "MultiPoint": 6,
+    "MultiLineString": 7,
+    "MultiPolygon": 8,
+}
+"""Stored codes of the geometry types. Never reorder or reuse codes."""
+
+
+class GeometryTypeCode(types.TypeDecorator):
+    """SqlAlchemy type for soundevent geometry type names.
+
+    The names are stored as small integer codes (see `GEOMETRY_TYPE_CODES`)
+    instead of variable length strings.
+    """
+
+    impl = types.SmallInteger
 
     cache_ok = True
 
-    def process_bind_param(self, value: data.Geometry, _) -> str:  # type: ignore
-        return value.model_dump_json()
+    _names = {code: name for name, code in GEOMETRY_TYPE_CODES.items()}
+
+    def process_bind_param(self, value: str | None, _) -> int | None:
+        if value is None:
+            return value
+        return GEOMETRY_TYPE_CODES[value]
 
-    def process_result_value(
-        self,
-        value: str | None,
-        dialect,
-    ) -> data.Geometry | None:
+    def process_result_value(self, value: int | None, _) -> str | None:
         if value is None:
             return value
-        return data.geometry_validate(value, mode="json")
+        return self._names[value]
 
 
 class Base(AsyncAttrs, orm.MappedAsDataclass, orm.DeclarativeBase):
@@ -37,7 +37,7 @@ class ClipAnnotation(Base):
     """The UUID of the annotation."""
 
     clip_id: orm.Mapped[int] = orm.mapped_column(
-        ForeignKey("clip.id"),
+        ForeignKey("clip.id", ondelete="CASCADE"),
         nullable=False,
     )
     """The database id of the clip being annotated."""
@@ -142,7 +142,7 @@ class ClipAnnotationTag(Base):
     """The database id of the annotation tag."""
 
     clip_annotation_id: orm.Mapped[int] = orm.mapped_column(
-        ForeignKey("clip_annotation.id")
+        ForeignKey("clip_annotation.id", ondelete="CASCADE")
     )
     """The database id of the annotation to which the tag belongs"""
 
@@ -192,11 +192,13 @@ class ClipAnnotationNote(Base):
     """The database id of the annotation note."""
 
     clip_annotation_id: orm.Mapped[int] = orm.mapped_column(
-        ForeignKey("clip_annotation.id")
+        ForeignKey("clip_annotation.id", ondelete="CASCADE")
     )
     """The database id of the annotation to which the note belongs."""
 
-    note_id: orm.Mapped[int] = orm.mapped_column(ForeignKey("note.id"))
+    note_id: orm.Mapped[int] = orm.mapped_column(
+        ForeignKey("note.id", ondelete="CASCADE")
+    )
     """The database id of the note attached to the annotation."""
 
     # Relations
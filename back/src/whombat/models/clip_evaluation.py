@@ -53,19 +53,19 @@ class ClipEvaluation(Base):
     """A unique UUID for the clip evaluation."""
 
     evaluation_id: orm.Mapped[int] = orm.mapped_column(
-        ForeignKey("evaluation.id"),
+        ForeignKey("evaluation.id", ondelete="CASCADE"),
         nullable=False,
     )
     """The ID of the overall evaluation to which this clip evaluation belongs."""
 
     clip_annotation_id: orm.Mapped[int] = orm.mapped_column(
-        ForeignKey("clip_annotation.id"),
+        ForeignKey("clip_annotation.id", ondelete="CASCADE"),
         nullable=False,
     )
     """The ID of the ground truth clip annotation."""
 
     clip_prediction_id: orm.Mapped[int] = orm.mapped_column(
-        ForeignKey("clip_prediction.id"),
+        ForeignKey("clip_prediction.id", ondelete="CASCADE"),
         nullable=False,
     )
     """The ID of the clip prediction."""
@@ -140,7 +140,7 @@ class ClipEvaluationMetric(Base):
     """The database ID of the metric."""
 
     clip_evaluation_id: orm.Mapped[int] = orm.mapped_column(
-        ForeignKey("clip_evaluation.id"),
+        ForeignKey("clip_evaluation.id", ondelete="CASCADE"),
         nullable=False,
     )
     """The ID of the clip evaluation to which this metric belongs."""
@@ -32,7 +32,7 @@ class ClipPrediction(Base):
     """The UUID of the clip prediction."""
 
     clip_id: orm.Mapped[int] = orm.mapped_column(
-        ForeignKey("clip.id"),
+        ForeignKey("clip.id", ondelete="CASCADE"),
         nullable=False,
     )
     """The database id of the clip to which the prediction belongs."""
@@ -77,7 +77,7 @@ class ClipPredictionTag(Base):
     )
 
     clip_prediction_id: orm.Mapped[int] = orm.mapped_column(
-        ForeignKey("clip_prediction.id"),
+        ForeignKey("clip_prediction.id", ondelete="CASCADE"),
         primary_key=True,
         nullable=False,
     )
@@ -18,7 +18,15 @@ from pathlib import Path
 from uuid import UUID, uuid4
 
 import sqlalchemy.orm as orm
-from sqlalchemy import ForeignKey, UniqueConstraint, func, inspect, select
+from sqlalchemy import (
+    ForeignKey,
+    Index,
+    String,
+    Uuid,
+    func,
+    inspect,
+    select,
+)
 
 from whombat.models.base import Base
 from whombat.models.recording import Recording
@@ -46,13 +54,17 @@ class Dataset(Base):
     """The database id of the dataset."""
 
     uuid: orm.Mapped[UUID] = orm.mapped_column(
+        Uuid(as_uuid=True, native_uuid=True),
         default_factory=uuid4,
         unique=True,
         kw_only=True,
     )
     """The UUID of the dataset."""
 
-    name: orm.Mapped[str] = orm.mapped_column(unique=True)
+    name: orm.Mapped[str] = orm.mapped_column(
+        String(length=255),
+        unique=True,
+    )
     """The name of the dataset."""
 
     description: orm.Mapped[str] = orm.mapped_column(nullable=True)
@@ -72,6 +84,9 @@ class Dataset(Base):
     )
 
     # Secondary relations
+    # NOTE: Deletes are not passive on this side because removing a dataset
+    # also removes its recordings, which the ORM cascades through each
+    # dataset recording. The database cascade only covers the link rows.
     dataset_recordings: orm.Mapped[list["DatasetRecording"]] = (
         orm.relationship(
             "DatasetRecording",
@@ -79,6 +94,7 @@ class Dataset(Base):
             repr=False,
             back_populates="dataset",
             cascade="all, delete-orphan",
+            lazy="raise",
             default_factory=list,
         )
     )
@@ -98,22 +114,29 @@ class DatasetRecording(Base):
     studies or deployments. However, as we do not want to duplicate recordings
     in the database, we use a many-to-many relationship to link recordings to
     datasets.
+
+    The primary key on `(dataset_id, recording_id)` already guarantees that
+    a recording is linked at most once to a dataset, so no additional unique
+    constraint is needed.
     """
 
     __tablename__ = "dataset_recording"
-    __table_args__ = (UniqueConstraint("dataset_id", "recording_id", "path"),)
+    __table_args__ = (
+        Index("ix_dataset_recording_dataset_id_path", "dataset_id", "path"),
+    )
 
     dataset_id: orm.Mapped[int] = orm.mapped_column(
-        ForeignKey("dataset.id"),
+        ForeignKey("dataset.id", ondelete="CASCADE"),
         nullable=False,
         primary_key=True,
     )
     """The id of the dataset."""
 
     recording_id: orm.Mapped[int] = orm.mapped_column(
-        ForeignKey("recording.id"),
+        ForeignKey("recording.id", ondelete="CASCADE"),
         nullable=False,
         primary_key=True,
+        index=True,
     )
     """The id of the recording."""
 
@@ -121,17 +144,23 @@ class DatasetRecording(Base):
     """The path to the recording within the dataset."""
 
     # Relations
+    # NOTE: Dataset recordings are always fetched in the context of a known
+    # dataset, so the dataset is never loaded through this side.
     dataset: orm.Mapped[Dataset] = orm.relationship(
         init=False,
         repr=False,
         back_populates="dataset_recordings",
+        lazy="raise",
     )
 
+    # NOTE: Recordings eagerly join their notes, tags, features and owners,
+    # so joining them here would repeat every dataset recording row once per
+    # related item. Loading them with a separate IN query avoids this.
     recording: orm.Mapped[Recording] = orm.relationship(
         Recording,
         init=False,
         repr=False,
-        lazy="joined",
+        lazy="selectin",
         back_populates="recording_datasets",
         cascade="all",
     )
@@ -113,7 +113,7 @@ class EvaluationMetric(Base):
     """The database ID of the metric."""
 
     evaluation_id: orm.Mapped[int] = orm.mapped_column(
-        ForeignKey("evaluation.id"),
+        ForeignKey("evaluation.id", ondelete="CASCADE"),
         nullable=False,
     )
     """The ID of the evaluation to which this metric belongs."""
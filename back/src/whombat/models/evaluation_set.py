@@ -145,12 +145,12 @@ class EvaluationSetAnnotation(Base):
     )
 
     evaluation_set_id: orm.Mapped[int] = orm.mapped_column(
-        ForeignKey("evaluation_set.id"),
+        ForeignKey("evaluation_set.id", ondelete="CASCADE"),
         nullable=False,
         primary_key=True,
     )
     clip_annotation_id: orm.Mapped[int] = orm.mapped_column(
-        ForeignKey("clip_annotation.id"),
+        ForeignKey("clip_annotation.id", ondelete="CASCADE"),
         nullable=False,
         primary_key=True,
     )
@@ -174,7 +174,7 @@ class EvaluationSetTag(Base):
     __table_args__ = (UniqueConstraint("evaluation_set_id", "tag_id"),)
 
     evaluation_set_id: orm.Mapped[int] = orm.mapped_column(
-        ForeignKey("evaluation_set.id"),
+        ForeignKey("evaluation_set.id", ondelete="CASCADE"),
         nullable=False,
         primary_key=True,
     )
@@ -205,12 +205,12 @@ class EvaluationSetModelRun(Base):
     __table_args__ = (UniqueConstraint("evaluation_set_id", "model_run_id"),)
 
     evaluation_set_id: orm.Mapped[int] = orm.mapped_column(
-        ForeignKey("evaluation_set.id"),
+        ForeignKey("evaluation_set.id", ondelete="CASCADE"),
         nullable=False,
         primary_key=True,
     )
     model_run_id: orm.Mapped[int] = orm.mapped_column(
-        ForeignKey("model_run.id"),
+        ForeignKey("model_run.id", ondelete="CASCADE"),
         nullable=False,
         primary_key=True,
     )
@@ -243,14 +243,14 @@ class EvaluationSetUserRun(Base):
     __table_args__ = (UniqueConstraint("evaluation_set_id", "user_run_id"),)
 
     evaluation_set_id: orm.Mapped[int] = orm.mapped_column(
-        ForeignKey("evaluation_set.id"),
+        ForeignKey("evaluation_set.id", ondelete="CASCADE"),
         nullable=False,
         primary_key=True,
     )
     """The ID of the associated EvaluationSet."""
 
     user_run_id: orm.Mapped[int] = orm.mapped_column(
-        ForeignKey("user_run.id"),
+        ForeignKey("user_run.id", ondelete="CASCADE"),
         nullable=False,
         primary_key=True,
     )
@@ -113,14 +113,14 @@ class ModelRunPrediction(Base):
     __table_args__ = (UniqueConstraint("model_run_id", "clip_prediction_id"),)
 
     model_run_id: orm.Mapped[int] = orm.mapped_column(
-        ForeignKey("model_run.id"),
+        ForeignKey("model_run.id", ondelete="CASCADE"),
         nullable=False,
         primary_key=True,
     )
     """The id of the model run associated with the prediction."""
 
     clip_prediction_id: orm.Mapped[int] = orm.mapped_column(
-        ForeignKey("clip_prediction.id"),
+        ForeignKey("clip_prediction.id", ondelete="CASCADE"),
         nullable=False,
         primary_key=True,
     )
@@ -139,21 +139,21 @@ class ModelRunEvaluation(Base):
     )
 
     model_run_id: orm.Mapped[int] = orm.mapped_column(
-        ForeignKey("model_run.id"),
+        ForeignKey("model_run.id", ondelete="CASCADE"),
         nullable=False,
         primary_key=True,
     )
     """The id of the model run associated with the evaluation."""
 
     evaluation_set_id: orm.Mapped[int] = orm.mapped_column(
-        ForeignKey("evaluation_set.id"),
+        ForeignKey("evaluation_set.id", ondelete="CASCADE"),
         nullable=False,
         primary_key=True,
     )
     """The id of the evaluation set associated with the model run evaluation."""
 
     evaluation_id: orm.Mapped[int] = orm.mapped_column(
-        ForeignKey("evaluation.id"),
+        ForeignKey("evaluation.id", ondelete="CASCADE"),
         nullable=False,
         primary_key=True,
     )
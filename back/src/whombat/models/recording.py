@@ -180,6 +180,8 @@ class Recording(Base):
             repr=False,
             cascade="all, delete-orphan",
             back_populates="recording",
+            lazy="raise",
+            passive_deletes=True,
             default_factory=list,
         )
     )
@@ -192,14 +194,14 @@ class RecordingNote(Base):
     __table_args__ = (UniqueConstraint("recording_id", "note_id"),)
 
     recording_id: orm.Mapped[int] = orm.mapped_column(
-        ForeignKey("recording.id"),
+        ForeignKey("recording.id", ondelete="CASCADE"),
         nullable=False,
         primary_key=True,
     )
     """The id of the recording."""
 
     note_id: orm.Mapped[int] = orm.mapped_column(
-        ForeignKey("note.id"),
+        ForeignKey("note.id", ondelete="CASCADE"),
         nullable=False,
         primary_key=True,
     )
@@ -228,7 +230,7 @@ class RecordingTag(Base):
     __table_args__ = (UniqueConstraint("recording_id", "tag_id"),)
 
     recording_id: orm.Mapped[int] = orm.mapped_column(
-        ForeignKey("recording.id"),
+        ForeignKey("recording.id", ondelete="CASCADE"),
         nullable=False,
         primary_key=True,
     )
@@ -275,7 +277,7 @@ class RecordingFeature(Base):
     )
 
     recording_id: orm.Mapped[int] = orm.mapped_column(
-        ForeignKey("recording.id"),
+        ForeignKey("recording.id", ondelete="CASCADE"),
         nullable=False,
         primary_key=True,
     )
@@ -320,7 +322,7 @@ class RecordingOwner(Base):
     __table_args__ = (UniqueConstraint("recording_id", "user_id"),)
 
     recording_id: orm.Mapped[int] = orm.mapped_column(
-        ForeignKey("recording.id"),
+        ForeignKey("recording.id", ondelete="CASCADE"),
         nullable=False,
         primary_key=True,
     )
@@ -35,10 +35,10 @@ from uuid import UUID, uuid4
 
 import sqlalchemy.orm as orm
 from soundevent import Geometry
-from sqlalchemy import ForeignKey, UniqueConstraint
+from sqlalchemy import ForeignKey, Index, UniqueConstraint, Uuid
 from sqlalchemy.ext.associationproxy import AssociationProxy, association_proxy
 
-from whombat.models.base import Base
+from whombat.models.base import Base, GeometryTypeCode
 from whombat.models.feature import FeatureName
 from whombat.models.recording import Recording
 
@@ -57,36 +57,87 @@ class SoundEvent(Base):
 
     Notes
     -----
-    The geometry attribute is stored as a JSON string in the database.
+    The geometry attribute is stored in a native JSON column in the database
+    (JSONB on PostgreSQL, where it is also covered by a GIN index).
+
+    The geometry type is stored as a small integer code rather than as
+    the name of the type.
+
+    The UUID is stored in the native UUID type when the database has one
+    (16 bytes on PostgreSQL) and as a 32 character hex string otherwise.
+
+    The time and frequency bounds of the geometry are duplicated into
+    plain float columns so that range queries can be answered by the
+    database (and its indices) without parsing the geometry. They are
+    computed from the geometry whenever it is written and must be kept in
+    sync with it.
+
+    The `recording_id` column does not need an index of its own as it
+    leads the `(recording_id, time_start, time_end)` index.
     """
 
     __tablename__ = "sound_event"
+    __table_args__ = (
+        Index(
+            "ix_sound_event_geometry",
+            "geometry",
+            postgresql_using="gin",
+        ).ddl_if(dialect="postgresql"),
+        Index(
+            "ix_sound_event_recording_id_time",
+            "recording_id",
+            "time_start",
+            "time_end",
+        ),
+    )
 
     id: orm.Mapped[int] = orm.mapped_column(primary_key=True, init=False)
     """The database id of the sound event."""
 
     uuid: orm.Mapped[UUID] = orm.mapped_column(
+        Uuid(as_uuid=True, native_uuid=True),
         default_factory=uuid4,
         kw_only=True,
     )
     """The UUID of the sound event."""
 
     recording_id: orm.Mapped[int] = orm.mapped_column(
-        ForeignKey("recording.id"),
+        ForeignKey("recording.id", ondelete="CASCADE"),
         nullable=False,
     )
     """The id of the recording to which the sound event belongs."""
 
-    geometry_type: orm.Mapped[str] = orm.mapped_column(nullable=False)
+    geometry_type: orm.Mapped[str] = orm.mapped_column(
+        GeometryTypeCode(),
+        nullable=False,
+    )
     """The type of geometry used to mark the RoI of the sound event."""
 
     geometry: orm.Mapped[Geometry] = orm.mapped_column(nullable=False)
     """The geometry of the mark used to mark the RoI of the sound event."""
 
+    time_start: orm.Mapped[float | None] = orm.mapped_column(default=None)
+    """The start time of the sound event in seconds."""
+
+    time_end: orm.Mapped[float | None] = orm.mapped_column(default=None)
+    """The end time of the sound event in seconds."""
+
+    freq_low: orm.Mapped[float | None] = orm.mapped_column(default=None)
+    """The lowest frequency of the sound event in Hz."""
+
+    freq_high: orm.Mapped[float | None] = orm.mapped_column(default=None)
+    """The highest frequency of the sound event in Hz."""
+
     # Relations
+    # NOTE: Lazy loading the recording of each sound event issues one query
+    # per row. Code that needs the recordings of many sound events must load
+    # them explicitly with `orm.selectinload(SoundEvent.recording)`. Large
+    # scans should also stream with `execution_options(yield_per=...)`,
+    # which requires loading `features` with `selectinload` as well.
     recording: orm.Mapped[Recording] = orm.relationship(
         init=False,
         repr=False,
+        lazy="raise",
     )
     """The recording to which the sound event belongs."""
 
@@ -95,6 +146,7 @@ class SoundEvent(Base):
         back_populates="sound_event",
         cascade="all, delete-orphan",
         lazy="joined",
+        passive_deletes=True,
         init=False,
         repr=False,
         default_factory=list,
@@ -131,7 +183,7 @@ class SoundEventFeature(Base):
     )
 
     sound_event_id: orm.Mapped[int] = orm.mapped_column(
-        ForeignKey("sound_event.id"),
+        ForeignKey("sound_event.id", ondelete="CASCADE"),
         nullable=False,
         primary_key=True,
     )
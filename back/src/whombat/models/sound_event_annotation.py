@@ -39,7 +39,7 @@ class SoundEventAnnotation(Base):
     """The UUID of the annotation."""
 
     clip_annotation_id: orm.Mapped[int] = orm.mapped_column(
-        ForeignKey("clip_annotation.id"),
+        ForeignKey("clip_annotation.id", ondelete="CASCADE"),
         nullable=False,
     )
     """The id of the clip annotation to which the annotation belongs."""
@@ -50,7 +50,7 @@ class SoundEventAnnotation(Base):
     """The id of the user who created the annotation."""
 
     sound_event_id: orm.Mapped[int] = orm.mapped_column(
-        ForeignKey("sound_event.id"),
+        ForeignKey("sound_event.id", ondelete="CASCADE"),
         nullable=False,
     )
     """The id of the sound event annotated by the annotation."""
@@ -134,14 +134,14 @@ class SoundEventAnnotationNote(Base):
     )
 
     sound_event_annotation_id: orm.Mapped[int] = orm.mapped_column(
-        ForeignKey("sound_event_annotation.id"),
+        ForeignKey("sound_event_annotation.id", ondelete="CASCADE"),
         primary_key=True,
         nullable=False,
     )
     """The id of the annotation to which the note belongs."""
 
     note_id: orm.Mapped[int] = orm.mapped_column(
-        ForeignKey("note.id"),
+        ForeignKey("note.id", ondelete="CASCADE"),
         primary_key=True,
         nullable=False,
     )
@@ -179,7 +179,7 @@ class SoundEventAnnotationTag(Base):
     """The database id of the annotation tag."""
 
     sound_event_annotation_id: orm.Mapped[int] = orm.mapped_column(
-        ForeignKey("sound_event_annotation.id"),
+        ForeignKey("sound_event_annotation.id", ondelete="CASCADE"),
         index=True,
     )
     """The id of the annotation to which the annotation tag belongs."""
@@ -46,19 +46,19 @@ class SoundEventEvaluation(Base):
     """A unique UUID for the sound event evaluation."""
 
     clip_evaluation_id: orm.Mapped[int] = orm.mapped_column(
-        ForeignKey("clip_evaluation.id"),
+        ForeignKey("clip_evaluation.id", ondelete="CASCADE"),
         nullable=False,
     )
     """The ID of the clip evaluation to which this evaluation belongs."""
 
     source_id: orm.Mapped[int | None] = orm.mapped_column(
-        ForeignKey("sound_event_prediction.id"),
+        ForeignKey("sound_event_prediction.id", ondelete="SET NULL"),
         nullable=True,
     )
     """The id of the predicted sound event."""
 
     target_id: orm.Mapped[int | None] = orm.mapped_column(
-        ForeignKey("sound_event_annotation.id"),
+        ForeignKey("sound_event_annotation.id", ondelete="SET NULL"),
         nullable=True,
     )
     """The ID of the target (ground truth) sound event annotation."""
@@ -128,7 +128,7 @@ class SoundEventEvaluationMetric(Base):
     """The database ID of the metric."""
 
     sound_event_evaluation_id: orm.Mapped[int] = orm.mapped_column(
-        ForeignKey("sound_event_evaluation.id"),
+        ForeignKey("sound_event_evaluation.id", ondelete="CASCADE"),
         nullable=False,
     )
     """The ID of the sound event evaluation to which this metric belongs."""
@@ -52,13 +52,13 @@ class SoundEventPrediction(Base):
     """The UUID of the sound event prediction."""
 
     sound_event_id: orm.Mapped[int] = orm.mapped_column(
-        ForeignKey("sound_event.id"),
+        ForeignKey("sound_event.id", ondelete="CASCADE"),
         nullable=False,
     )
     """The database id of the predicted sound event."""
 
     clip_prediction_id: orm.Mapped[int] = orm.mapped_column(
-        ForeignKey("clip_prediction.id"),
+        ForeignKey("clip_prediction.id", ondelete="CASCADE"),
         nullable=False,
     )
     """The database id of the clip prediction to which the sound event belongs."""
@@ -114,7 +114,7 @@ class SoundEventPredictionTag(Base):
     )
 
     sound_event_prediction_id: orm.Mapped[int] = orm.mapped_column(
-        ForeignKey("sound_event_prediction.id"),
+        ForeignKey("sound_event_prediction.id", ondelete="CASCADE"),
         primary_key=True,
         nullable=False,
     )
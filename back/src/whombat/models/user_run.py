@@ -115,14 +115,14 @@ class UserRunPrediction(Base):
     __table_args__ = (UniqueConstraint("user_run_id", "clip_prediction_id"),)
 
     user_run_id: orm.Mapped[int] = orm.mapped_column(
-        ForeignKey("user_run.id"),
+        ForeignKey("user_run.id", ondelete="CASCADE"),
         nullable=False,
         primary_key=True,
     )
     """The id of the user run associated with the prediction."""
 
     clip_prediction_id: orm.Mapped[int] = orm.mapped_column(
-        ForeignKey("clip_prediction.id"),
+        ForeignKey("clip_prediction.id", ondelete="CASCADE"),
         nullable=False,
         primary_key=True,
     )
@@ -136,21 +136,21 @@ class UserRunEvaluation(Base):
     __table_args__ = (UniqueConstraint("user_run_id", "evaluation_set_id"),)
 
     user_run_id: orm.Mapped[int] = orm.mapped_column(
-        ForeignKey("user_run.id"),
+        ForeignKey("user_run.id", ondelete="CASCADE"),
         nullable=False,
         primary_key=True,
     )
     """The id of the user run associated with the user run evaluation."""
 
     evaluation_set_id: orm.Mapped[int] = orm.mapped_column(
-        ForeignKey("evaluation_set.id"),
+        ForeignKey("evaluation_set.id", ondelete="CASCADE"),
         nullable=False,
         primary_key=True,
     )
     """The id of the evaluation set associated with the user run evaluation."""
 
     evaluation_id: orm.Mapped[int] = orm.mapped_column(
-        ForeignKey("evaluation.id"),
+        ForeignKey("evaluation.id", ondelete="CASCADE"),
         nullable=False,
         primary_key=True,
     )
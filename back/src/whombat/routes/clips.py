@@ -1,7 +1,7 @@
 """REST API routes for clips."""
 
 from typing import Annotated
-from uuid import UUID, uuid4
+from uuid import UUID
 
 from fastapi import APIRouter, Depends
 
@@ -74,7 +74,6 @@ async def create_clips(
         session,
         [
             dict(
-                uuid=uuid4(),
                 recording_id=recording_mapping[recording_uuid].id,
                 start_time=clip.start_time,
                 end_time=clip.end_time,
@@ -2,26 +2,22 @@
 
 from typing import Annotated, AsyncGenerator
 
-from fastapi import Depends
+from fastapi import Depends, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from whombat.routes.dependencies.settings import WhombatSettings
-from whombat.system.database import (
-    create_async_db_engine,
-    get_async_session,
-    get_database_url,
-)
+from whombat.system.database import get_async_session
 
 __all__ = ["Session"]
 
 
 async def async_session(
-    settings: WhombatSettings,
+    request: Request,
 ) -> AsyncGenerator[AsyncSession, None]:
-    """Get an async session for the database."""
-    url = get_database_url(settings)
-    engine = create_async_db_engine(url)
-    async with get_async_session(engine) as session:
+    """Get an async session for the database.
+
+    The session is bound to the engine created when the app starts.
+    """
+    async with get_async_session(request.app.state.db_engine) as session:
         yield session
 
 
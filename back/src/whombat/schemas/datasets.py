@@ -25,7 +25,7 @@ class DatasetCreate(BaseModel):
     audio_dir: DirectoryPath
     """The path to the directory containing the audio files."""
 
-    name: str = Field(..., min_length=1)
+    name: str = Field(..., min_length=1, max_length=255)
     """The name of the dataset."""
 
     description: str | None = Field(None)
@@ -60,7 +60,7 @@ class DatasetUpdate(BaseModel):
     audio_dir: DirectoryPath | None = None
     """The path to the directory containing the audio files."""
 
-    name: str | None = Field(default=None, min_length=1)
+    name: str | None = Field(default=None, min_length=1, max_length=255)
     """The name of the dataset."""
 
     description: str | None = None
@@ -12,18 +12,31 @@ from fastapi.staticfiles import StaticFiles
 from whombat import exceptions
 from whombat.plugins import add_plugin_pages, add_plugin_routes, load_plugins
 from whombat.system.boot import whombat_init
+from whombat.system.database import (
+    create_server_db_engine,
+    warm_up_db_engine,
+)
 from whombat.system.settings import Settings
 
 ROOT_DIR = Path(__file__).parent.parent
 
 
 @asynccontextmanager
-async def lifespan(settings: Settings, _: FastAPI):
+async def lifespan(settings: Settings, app: FastAPI):
     """Context manager to run startup and shutdown events."""
     await whombat_init(settings)
 
+    # NOTE: All requests share one engine, so its connection pool and its
+    # cache of compiled statements outlive each request.
+    engine = create_server_db_engine(settings)
+    if engine.dialect.name != "sqlite":
+        await warm_up_db_engine(engine, settings.db_pool_size)
+    app.state.db_engine = engine
+
     yield
 
+    await engine.dispose()
+
 
 def create_app(settings: Settings) -> FastAPI:
     # NOTE: Import the routes here to avoid circular imports
@@ -1,7 +1,8 @@
 """Function to initialize the database."""
 
+import asyncio
 import logging
-from contextlib import asynccontextmanager
+from contextlib import AsyncExitStack, asynccontextmanager
 from enum import Enum
 from pathlib import Path
 from typing import AsyncGenerator
@@ -10,7 +11,7 @@ from alembic import script
 from alembic.command import stamp, upgrade
 from alembic.config import Config
 from alembic.runtime import migration
-from sqlalchemy import Connection, Engine, create_engine
+from sqlalchemy import Connection, Engine, create_engine, event, text
 from sqlalchemy.engine import URL, make_url
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
@@ -30,6 +31,7 @@ __all__ = [
     "create_or_update_db",
     "create_async_db_engine",
     "create_sync_db_engine",
+    "create_server_db_engine",
     "get_database_url",
     "get_db_state",
     "init_database",
@@ -37,6 +39,7 @@ __all__ = [
     "models",
     "run_migrations",
     "validate_database_url",
+    "warm_up_db_engine",
 ]
 
 
@@ -128,7 +131,21 @@ def get_database_url(
     return validate_database_url(url, is_async=is_async)
 
 
-def create_async_db_engine(database_url: str | URL) -> AsyncEngine:
+def enable_sqlite_foreign_keys(dbapi_connection, _) -> None:
+    """Turn on foreign key enforcement for a new SQLite connection.
+
+    SQLite ignores foreign key constraints, including their ``ON DELETE``
+    actions, unless this pragma is set on every connection.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA foreign_keys=ON")
+    cursor.close()
+
+
+def create_async_db_engine(
+    database_url: str | URL,
+    **kwargs,
+) -> AsyncEngine:
     """Create the database engine.
 
     Parameters
@@ -137,6 +154,9 @@ def create_async_db_engine(database_url: str | URL) -> AsyncEngine:
         The url to the database. Defaults to `sqlite+aiosqlite://`. See
         https://docs.sqlalchemy.org/en/14/core/engines.html#database-urls for
         more information on the format.
+    **kwargs
+        Additional arguments for `create_async_engine`, such as the
+        connection pool options.
 
     Notes
     -----
@@ -152,7 +172,48 @@ def create_async_db_engine(database_url: str | URL) -> AsyncEngine:
         database_url = make_url(database_url)
 
     database_url = validate_database_url(database_url, is_async=True)
-    return create_async_engine(database_url)
+    engine = create_async_engine(database_url, **kwargs)
+
+    if engine.dialect.name == "sqlite":
+        event.listen(engine.sync_engine, "connect", enable_sqlite_foreign_keys)
+
+    return engine
+
+
+def create_server_db_engine(settings: Settings) -> AsyncEngine:
+    """Create the engine shared by all requests to the server.
+
+    For server databases the connection pool is sized from the settings.
+    SQLite keeps the default pool, as its connections are cheap to open
+    and writes are serialised anyway.
+    """
+    database_url = get_database_url(settings)
+    if database_url.get_backend_name() == "sqlite":
+        return create_async_db_engine(database_url)
+
+    return create_async_db_engine(
+        database_url,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_recycle=3600,
+    )
+
+
+async def warm_up_db_engine(engine: AsyncEngine, connections: int) -> None:
+    """Open connections ahead of time so requests do not wait for them.
+
+    The connections are held open together, so the pool has to create
+    that many, and are then returned to the pool.
+    """
+    async with AsyncExitStack() as stack:
+        conns = await asyncio.gather(
+            *(
+                stack.enter_async_context(engine.connect())
+                for _ in range(connections)
+            )
+        )
+        for conn in conns:
+            await conn.execute(text("SELECT 1"))
 
 
 def create_sync_db_engine(database_url: str | URL) -> Engine:
@@ -173,7 +234,12 @@ def create_sync_db_engine(database_url: str | URL) -> Engine:
     if not isinstance(database_url, URL):
         database_url = make_url(database_url)
     database_url = validate_database_url(database_url, is_async=False)
-    return create_engine(database_url)
+    engine = create_engine(database_url)
+
+    if engine.dialect.name == "sqlite":
+        event.listen(engine, "connect", enable_sqlite_foreign_keys)
+
+    return engine
 
 
 def create_alembic_config(db_url: str | URL, is_async: bool = True) -> Config:
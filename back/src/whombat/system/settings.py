@@ -63,6 +63,17 @@ class Settings(BaseSettings):
     Only use this if you know what you are doing.
     """
 
+    db_pool_size: int = 5
+    """Number of connections the server keeps open to the database.
+
+    Only used for server databases such as PostgreSQL; SQLite opens its
+    connections on demand. Values between 25 and 50 suit deployments
+    serving many concurrent clients.
+    """
+
+    db_max_overflow: int = 10
+    """Connections that may be opened beyond the pool size under load."""
+
     audio_dir: Path = Path.home()
     """Directory where the all audio files are stored.
 
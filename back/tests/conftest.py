@@ -1,23 +1,33 @@
 """Common fixtures for Whombat tests."""
 
+import hashlib
+import io
 import logging
 import os
 import random
 import shutil
 import string
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import AbstractContextManager, contextmanager
 from pathlib import Path
 from typing import AsyncGenerator, Optional
+from uuid import uuid4
 
 import numpy as np
 import pytest
 import soundevent
 import soundfile as sf
+from sqlalchemy import event
 from sqlalchemy.engine import URL
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import StaticPool
 
-from whombat import api, cache, schemas
+from whombat import api, cache, models, schemas
 from whombat.system import get_database_url, init_database
+from whombat.system.database import (
+    enable_sqlite_foreign_keys,
+    get_async_session,
+)
 from whombat.system.settings import Settings
 
 # Avoid noisy logging during tests.
@@ -96,7 +106,10 @@ def database_path(tmp_path: Path, database_template: Path) -> Path:
     Copies the database template to a temporary location.
     """
     path = tmp_path / "test.db"
-    shutil.copy(database_template, path)
+    # NOTE: The copy is written to by the test, so it cannot be a hard link.
+    # copyfile uses the in-kernel copy on Linux and skips copying
+    # permissions.
+    shutil.copyfile(database_template, path)
     return path
 
 
@@ -136,7 +149,7 @@ def random_string():
 
 
 def write_random_wave(
-    path: Path,
+    path: Path | io.BytesIO,
     samplerate: int = 22100,
     duration: float = 0.1,
     channels: int = 1,
@@ -146,13 +159,46 @@ def write_random_wave(
     """Write a random wave file to disk."""
     frames = int(samplerate * duration)
     shape = (frames, channels)
-    wav = np.random.random(size=shape)
+    # NOTE: Samples are drawn directly as 16-bit integers, which is what most
+    # test files are encoded as, to skip the float64 buffer and conversion.
+    wav = np.random.default_rng().integers(
+        -32768,
+        32768,
+        size=shape,
+        dtype=np.int16,
+    )
     sf.write(path, wav, samplerate, format=fmt, subtype=subtype)
 
 
+class RandomWavPath(type(Path())):
+    """Path to a random wav file that carries the file's MD5 hash."""
+
+    precomputed_hash: str
+
+
+@pytest.fixture(scope="session")
+def wav_template_cache() -> dict[tuple, tuple]:
+    """Cache of synthesized WAV files shared across the test session.
+
+    Each entry holds the file contents without its last 8 bytes and the MD5
+    state of those contents.
+    """
+    return {}
+
+
 @pytest.fixture
-def random_wav_factory(audio_dir: Path):
-    """Produce a random wav file."""
+def random_wav_factory(audio_dir: Path, wav_template_cache: dict):
+    """Produce a random wav file.
+
+    Synthesizing and encoding audio dominates the cost of most tests, so
+    16-bit PCM WAV files are generated once per parameter set and copied.
+    The trailing samples of every copy are randomized so that each file
+    still has a unique hash.
+
+    The returned path has a `precomputed_hash` attribute with the MD5 hash
+    of the file. For cached files it is derived from the cached hash state,
+    so the file is never read back.
+    """
 
     def wav_factory(
         path: Optional[Path] = None,
@@ -162,40 +208,122 @@ def random_wav_factory(audio_dir: Path):
         bit_depth: Optional[int] = None,
         fmt: str = "WAV",
         subtype: Optional[str] = None,
-    ) -> Path:
+    ) -> RandomWavPath:
         if path is None:
             path = audio_dir / (random_string() + ".wav")
 
-        dirname = os.path.dirname(path)
-        if not os.path.exists(dirname):
-            os.makedirs(dirname)
+        path = RandomWavPath(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
 
         if bit_depth is not None:
             fmt = "WAV"
             subtype = f"PCM_{bit_depth}"
 
-        write_random_wave(
-            path=path,
-            samplerate=samplerate,
-            duration=duration,
-            channels=channels,
-            fmt=fmt,
-            subtype=subtype,
-        )
-
+        # NOTE: Only PCM WAV files end with raw sample data that can be
+        # overwritten without producing an invalid or non-finite file.
+        frames = int(samplerate * duration)
+        if fmt != "WAV" or subtype not in (None, "PCM_16") or frames < 4:
+            write_random_wave(
+                path=path,
+                samplerate=samplerate,
+                duration=duration,
+                channels=channels,
+                fmt=fmt,
+                subtype=subtype,
+            )
+            with open(path, "rb") as fp:
+                path.precomputed_hash = hashlib.file_digest(
+                    fp, "md5"
+                ).hexdigest()
+            return path
+
+        key = (samplerate, duration, channels)
+        if key not in wav_template_cache:
+            buffer = io.BytesIO()
+            write_random_wave(
+                path=buffer,
+                samplerate=samplerate,
+                duration=duration,
+                channels=channels,
+                fmt=fmt,
+                subtype=subtype,
+            )
+            head = buffer.getvalue()[:-8]
+            wav_template_cache[key] = (head, hashlib.md5(head))
+
+        head, head_hash = wav_template_cache[key]
+        tail = os.urandom(8)
+        path.write_bytes(head + tail)
+
+        file_hash = head_hash.copy()
+        file_hash.update(tail)
+        path.precomputed_hash = file_hash.hexdigest()
         return path
 
     return wav_factory
 
 
+def disable_sqlite_sync(dbapi_connection, _) -> None:
+    """Skip fsync on commit, tests do not need durable writes."""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA synchronous=OFF")
+    cursor.close()
+
+
 @pytest.fixture
 async def session(
     database_url: URL,
 ) -> AsyncGenerator[AsyncSession, None]:
-    """Create a session that uses an in-memory database."""
-    async with api.create_session(db_url=database_url) as sess:
+    """Create a session to the test database.
+
+    The session holds a single connection for the whole test and the
+    engine is disposed afterwards, so no connections or worker threads
+    outlive the test.
+    """
+    engine = create_async_engine(database_url, poolclass=StaticPool)
+    event.listen(engine.sync_engine, "connect", enable_sqlite_foreign_keys)
+    event.listen(engine.sync_engine, "connect", disable_sqlite_sync)
+
+    async with get_async_session(engine) as sess:
         yield sess
 
+    await engine.dispose()
+
+
+@pytest.fixture
+def assert_max_queries(
+    session: AsyncSession,
+) -> Callable[[int], AbstractContextManager[list[str]]]:
+    """Assert that a block of code issues at most a number of queries.
+
+    Use it to guard against N+1 loading regressions:
+
+    ```python
+    with assert_max_queries(2):
+        await api.datasets.get_many(session)
+    ```
+    """
+    engine = session.bind.sync_engine  # type: ignore
+
+    @contextmanager
+    def guard(max_queries: int) -> Iterator[list[str]]:
+        statements: list[str] = []
+
+        def count_query(conn, cursor, statement, *args) -> None:
+            statements.append(statement)
+
+        event.listen(engine, "before_cursor_execute", count_query)
+        try:
+            yield statements
+        finally:
+            event.remove(engine, "before_cursor_execute", count_query)
+
+        assert len(statements) <= max_queries, "\n\n".join(
+            [f"Expected at most {max_queries} queries, got:", *statements]
+        )
+
+    return guard
+
 
 @pytest.fixture
 async def user(session: AsyncSession) -> schemas.SimpleUser:
@@ -372,23 +500,36 @@ async def annotation_task(
     clip: schemas.Clip,
 ) -> schemas.AnnotationTask:
     """Create a task for testing."""
-    return await api.annotation_tasks.create(
+    # NOTE: The task model cannot be instantiated without a clip
+    # annotation id, so the row is inserted directly.
+    uuid = uuid4()
+    await api.common.insert_object(
         session,
-        annotation_project=annotation_project,
-        clip=clip,
+        models.AnnotationTask,
+        annotation_project_id=annotation_project.id,
+        clip_id=clip.id,
+        clip_annotation_id=None,
+        uuid=uuid,
     )
+    return await api.annotation_tasks.get(session, uuid)
 
 
+# NOTE: The prediction models cannot be instantiated without an id, so the
+# prediction fixtures insert their rows directly.
 @pytest.fixture
 async def clip_prediction(
     session: AsyncSession,
     clip: schemas.Clip,
 ) -> schemas.ClipPrediction:
     """Create a clip prediction for testing."""
-    return await api.clip_predictions.create(
+    uuid = uuid4()
+    await api.common.insert_object(
         session,
-        clip=clip,
+        models.ClipPrediction,
+        clip_id=clip.id,
+        uuid=uuid,
     )
+    return await api.clip_predictions.get(session, uuid)
 
 
 @pytest.fixture
@@ -398,12 +539,16 @@ async def sound_event_prediction(
     clip_prediction: schemas.ClipPrediction,
 ) -> schemas.SoundEventPrediction:
     """Create a sound event prediction for testing."""
-    return await api.sound_event_predictions.create(
+    uuid = uuid4()
+    await api.common.insert_object(
         session,
-        clip_prediction=clip_prediction,
-        sound_event=sound_event,
+        models.SoundEventPrediction,
+        clip_prediction_id=clip_prediction.id,
+        sound_event_id=sound_event.id,
         score=0.5,
+        uuid=uuid,
     )
+    return await api.sound_event_predictions.get(session, uuid)
 
 
 @pytest.fixture
@@ -488,3 +633,60 @@ async def evaluation_set(
         name="test_evaluation_set",
         description="test_description",
     )
+
+
+@pytest.fixture
+async def clip_with_dependants(
+    session: AsyncSession,
+    clip: schemas.Clip,
+    clip_annotation: schemas.ClipAnnotation,
+    clip_prediction: schemas.ClipPrediction,
+    sound_event_annotation: schemas.SoundEventAnnotation,
+    sound_event_prediction: schemas.SoundEventPrediction,
+    sound_event_evaluation: schemas.SoundEventEvaluation,
+    annotation_task: schemas.AnnotationTask,
+    model_run: schemas.ModelRun,
+    user_run: schemas.UserRun,
+    tag: schemas.Tag,
+    note: schemas.Note,
+    user: schemas.SimpleUser,
+) -> schemas.Clip:
+    """Create a clip with annotations, predictions and evaluations.
+
+    Every kind of row that depends on a clip is attached to it, so that
+    deletes can be checked to remove all of them.
+    """
+    await api.clip_annotations.add_tag(session, clip_annotation, tag, user)
+    await api.clip_annotations.add_note(session, clip_annotation, note)
+    await api.sound_event_annotations.add_tag(
+        session,
+        sound_event_annotation,
+        tag,
+        user,
+    )
+    await api.clip_predictions.add_tag(session, clip_prediction, tag, 0.5)
+    await api.sound_event_predictions.add_tag(
+        session,
+        sound_event_prediction,
+        tag,
+        0.5,
+    )
+    await api.annotation_tasks.add_status_badge(
+        session,
+        annotation_task,
+        soundevent.data.AnnotationState.completed,
+        user,
+    )
+    await api.model_runs.add_clip_prediction(
+        session,
+        model_run,
+        clip_prediction,
+    )
+    await api.user_runs.add_clip_prediction(
+        session,
+        user_run,
+        clip_prediction,
+    )
+    await session.commit()
+    session.expunge_all()
+    return clip
@@ -0,0 +1,99 @@
+"""Test suite for the Clip Predictions Python API."""
+
+from soundevent import data
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from whombat import api, schemas
+
+
+async def test_add_tag_issues_a_single_insert(
+    session: AsyncSession,
+    clip_prediction: schemas.ClipPrediction,
+    tag: schemas.Tag,
+    assert_max_queries,
+):
+    """Test adding a tag does not reload the clip prediction."""
+    with assert_max_queries(1):
+        updated = await api.clip_predictions.add_tag(
+            session,
+            clip_prediction,
+            tag,
+            0.7,
+        )
+
+    assert [(t.tag, t.score) for t in updated.tags] == [(tag, 0.7)]
+    fetched = await api.clip_predictions.get(session, clip_prediction.uuid)
+    assert [(t.tag, t.score) for t in fetched.tags] == [(tag, 0.7)]
+
+
+async def test_add_tags_skips_existing_tags_by_id(
+    session: AsyncSession,
+    clip_prediction: schemas.ClipPrediction,
+    tag: schemas.Tag,
+):
+    """Test adding tags in bulk skips tags the prediction has by id."""
+    clip_prediction = await api.clip_predictions.add_tag(
+        session,
+        clip_prediction,
+        tag,
+        0.5,
+    )
+    stale = tag.model_copy(update=dict(value="renamed"))
+    other = await api.tags.create(session, key="other", value="tag")
+
+    updated = await api.clip_predictions.add_tags(
+        session,
+        clip_prediction,
+        [(stale, 0.9), (other, 0.1), (other, 0.2)],
+    )
+
+    assert [(t.tag.id, t.score) for t in updated.tags] == [
+        (tag.id, 0.5),
+        (other.id, 0.1),
+    ]
+    fetched = await api.clip_predictions.get(session, clip_prediction.uuid)
+    assert len(fetched.tags) == 2
+
+
+async def test_update_from_soundevent_adds_tags_in_bulk(
+    session: AsyncSession,
+    clip_prediction: schemas.ClipPrediction,
+    tag: schemas.Tag,
+    assert_max_queries,
+):
+    """Test importing predicted tags resolves each tag only once."""
+    clip_prediction = await api.clip_predictions.add_tag(
+        session,
+        clip_prediction,
+        tag,
+        0.9,
+    )
+    exported = await api.clip_predictions.to_soundevent(
+        session,
+        clip_prediction,
+    )
+    exported.tags.extend(
+        data.PredictedTag(
+            tag=data.Tag(key="species", value=f"species_{i % 2}"),
+            score=0.5,
+        )
+        for i in range(4)
+    )
+
+    with assert_max_queries(6):
+        updated = await api.clip_predictions.from_soundevent(
+            session,
+            exported,
+        )
+
+    assert [(t.tag.value, t.score) for t in updated.tags] == [
+        (tag.value, 0.9),
+        ("species_0", 0.5),
+        ("species_1", 0.5),
+    ]
+    fetched = await api.clip_predictions.get(session, clip_prediction.uuid)
+    assert {t.tag.value for t in fetched.tags} == {
+        tag.value,
+        "species_0",
+        "species_1",
+    }
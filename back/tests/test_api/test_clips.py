@@ -5,7 +5,7 @@ from uuid import uuid4
 
 import pytest
 from pydantic import ValidationError
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from whombat import api, exceptions, models, schemas
@@ -455,6 +455,48 @@ async def test_delete_clip_deletes_associated_features(
     assert result.scalars().first() is None
 
 
+async def test_delete_clip_deletes_its_annotations_and_predictions(
+    session: AsyncSession,
+    clip_with_dependants: schemas.Clip,
+):
+    """Test deleting a clip removes every row that depends on it."""
+    # Act
+    await api.clips.delete(session, clip_with_dependants)
+
+    # Assert
+    for model in [
+        models.ClipAnnotation,
+        models.ClipAnnotationTag,
+        models.ClipAnnotationNote,
+        models.ClipPrediction,
+        models.ClipPredictionTag,
+        models.SoundEventAnnotation,
+        models.SoundEventAnnotationTag,
+        models.SoundEventPrediction,
+        models.SoundEventPredictionTag,
+        models.AnnotationTask,
+        models.AnnotationStatusBadge,
+        models.ModelRunPrediction,
+        models.UserRunPrediction,
+        models.ClipEvaluation,
+        models.SoundEventEvaluation,
+    ]:
+        count = await session.scalar(select(func.count()).select_from(model))
+        assert count == 0, model.__tablename__
+
+    for model in [
+        models.SoundEvent,
+        models.Note,
+        models.Tag,
+        models.ModelRun,
+        models.UserRun,
+        models.Evaluation,
+        models.AnnotationProject,
+    ]:
+        count = await session.scalar(select(func.count()).select_from(model))
+        assert count == 1, model.__tablename__
+
+
 async def test_remove_feature_from_clip(
     session: AsyncSession,
     clip: schemas.Clip,
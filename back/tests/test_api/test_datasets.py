@@ -5,8 +5,12 @@ from collections.abc import Callable
 from pathlib import Path
 
 import pytest
-from sqlalchemy import select
+from pydantic import ValidationError
+from soundevent import data
+from sqlalchemy import func, select
+from sqlalchemy.exc import InvalidRequestError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from whombat import api, exceptions, models, schemas
 
@@ -89,6 +93,20 @@ async def test_create_dataset_fails_if_name_is_not_unique(
         )
 
 
+async def test_create_dataset_fails_if_name_is_too_long(
+    session: AsyncSession,
+    audio_dir: Path,
+):
+    """Test that dataset names cannot exceed the column length."""
+    with pytest.raises(ValidationError):
+        await api.datasets.create(
+            session,
+            name="a" * 256,
+            dataset_dir=audio_dir,
+            audio_dir=audio_dir,
+        )
+
+
 async def test_get_dataset_by_uuid(
     session: AsyncSession, dataset: schemas.Dataset
 ):
@@ -250,6 +268,144 @@ async def test_delete_dataset(session: AsyncSession, dataset: schemas.Dataset):
         await api.datasets.get(session, dataset.uuid)
 
 
+async def test_delete_dataset_removes_dataset_recordings(
+    session: AsyncSession,
+    dataset: schemas.Dataset,
+    random_wav_factory: Callable[..., Path],
+    audio_dir: Path,
+):
+    """Test that deleting a dataset removes its recording links."""
+    # Arrange
+    dataset_audio_dir = audio_dir / dataset.audio_dir
+    audio_file = random_wav_factory(path=dataset_audio_dir / "audio_file.wav")
+    recording = await api.recordings.create(
+        session,
+        path=audio_file,
+        audio_dir=audio_dir,
+    )
+    await api.datasets.add_recording(session, dataset, recording)
+
+    # Act
+    await api.datasets.delete(session, dataset)
+
+    # Assert
+    query = select(func.count()).select_from(models.DatasetRecording)
+    result = await session.execute(query)
+    assert result.scalar() == 0
+
+
+async def test_delete_recording_removes_it_from_datasets(
+    session: AsyncSession,
+    dataset: schemas.Dataset,
+    random_wav_factory: Callable[..., Path],
+    audio_dir: Path,
+):
+    """Test that the database cascades recording deletes to datasets."""
+    # Arrange
+    dataset_audio_dir = audio_dir / dataset.audio_dir
+    audio_file = random_wav_factory(path=dataset_audio_dir / "audio_file.wav")
+    recording = await api.recordings.create(
+        session,
+        path=audio_file,
+        audio_dir=audio_dir,
+    )
+    await api.datasets.add_recording(session, dataset, recording)
+    await session.commit()
+    session.expunge_all()
+
+    # Act
+    await api.recordings.delete(session, recording)
+
+    # Assert
+    query = select(func.count()).select_from(models.DatasetRecording)
+    result = await session.execute(query)
+    assert result.scalar() == 0
+    dataset = await api.datasets.get(session, dataset.uuid)
+    assert dataset.recording_count == 0
+
+
+async def test_delete_dataset_removes_clips_and_dependants(
+    session: AsyncSession,
+    recording: schemas.Recording,
+    clip_with_dependants: schemas.Clip,
+    audio_dir: Path,
+):
+    """Test deleting a dataset removes the clips of its recordings."""
+    # Arrange
+    dataset = await api.datasets.create(
+        session,
+        name="test_dataset",
+        dataset_dir=audio_dir,
+        audio_dir=audio_dir,
+    )
+    await api.datasets.add_recording(session, dataset, recording)
+    await session.commit()
+    session.expunge_all()
+
+    # Act
+    await api.datasets.delete(session, dataset)
+
+    # Assert
+    for model in [
+        models.Recording,
+        models.Clip,
+        models.SoundEvent,
+        models.ClipAnnotation,
+        models.ClipAnnotationTag,
+        models.ClipAnnotationNote,
+        models.ClipPrediction,
+        models.ClipPredictionTag,
+        models.SoundEventAnnotation,
+        models.SoundEventAnnotationTag,
+        models.SoundEventPrediction,
+        models.SoundEventPredictionTag,
+        models.AnnotationTask,
+        models.AnnotationStatusBadge,
+        models.ModelRunPrediction,
+        models.UserRunPrediction,
+        models.ClipEvaluation,
+        models.SoundEventEvaluation,
+    ]:
+        count = await session.scalar(select(func.count()).select_from(model))
+        assert count == 0, model.__tablename__
+
+
+async def test_dataset_recordings_are_not_lazy_loaded(
+    session: AsyncSession,
+    dataset: schemas.Dataset,
+    random_wav_factory: Callable[..., Path],
+    audio_dir: Path,
+):
+    """Test that dataset recordings must be loaded explicitly."""
+    # Arrange
+    dataset_audio_dir = audio_dir / dataset.audio_dir
+    audio_file = random_wav_factory(path=dataset_audio_dir / "audio_file.wav")
+    recording = await api.recordings.create(
+        session,
+        path=audio_file,
+        audio_dir=audio_dir,
+    )
+    await api.datasets.add_recording(session, dataset, recording)
+    session.expunge_all()
+    query = select(models.Dataset).where(models.Dataset.id == dataset.id)
+
+    # Act
+    result = await session.execute(query)
+    db_dataset = result.unique().scalar_one()
+
+    # Assert
+    with pytest.raises(InvalidRequestError):
+        db_dataset.dataset_recordings  # noqa: B018
+
+    session.expunge_all()
+    result = await session.execute(
+        query.options(selectinload(models.Dataset.dataset_recordings))
+    )
+    db_dataset = result.unique().scalar_one()
+    assert len(db_dataset.dataset_recordings) == 1
+    assert db_dataset.dataset_recordings[0].recording_id == recording.id
+
+
 async def test_get_dataset_files(
     session: AsyncSession,
     dataset: schemas.Dataset,
@@ -763,6 +919,41 @@ async def test_create_dataset_registers_all_recordings(
     assert len(all_recordings) == 2
 
 
+async def test_create_dataset_from_soundevent(
+    session: AsyncSession,
+    random_wav_factory: Callable[..., Path],
+    audio_dir: Path,
+):
+    """Test that all recordings of a soundevent dataset are linked."""
+    # Arrange
+    dataset_audio_dir = audio_dir / "soundevent_dataset"
+    paths = [
+        random_wav_factory(path=dataset_audio_dir / f"audio_file_{i}.wav")
+        for i in range(3)
+    ]
+    se_dataset = data.Dataset(
+        name="soundevent_dataset",
+        description="A soundevent dataset.",
+        recordings=[data.Recording.from_file(path) for path in paths],
+    )
+
+    # Act
+    dataset = await api.datasets.from_soundevent(
+        session,
+        se_dataset,
+        dataset_audio_dir=dataset_audio_dir,
+        audio_dir=audio_dir,
+    )
+
+    # Assert
+    assert dataset.recording_count == 3
+    query = select(func.count()).where(
+        models.DatasetRecording.dataset_id == dataset.id
+    )
+    result = await session.execute(query)
+    assert result.scalar() == 3
+
+
 async def test_exported_datasets_paths_are_not_absolute(
     session: AsyncSession,
     example_data_dir: Path,
@@ -787,3 +978,45 @@ async def test_exported_datasets_paths_are_not_absolute(
 
         # Check that paths were exported relative to the dataset audio_dir
         assert (audio_dir / recording.path).is_file()
+
+
+async def test_list_datasets_does_not_query_per_dataset(
+    session: AsyncSession,
+    audio_dir: Path,
+    random_wav_factory: Callable[..., Path],
+    assert_max_queries,
+):
+    """Test that listing datasets does not issue a query per dataset."""
+    # Arrange
+    for index in range(3):
+        dataset_dir = audio_dir / f"dataset_{index}"
+        dataset_dir.mkdir()
+        dataset = await api.datasets.create(
+            session,
+            name=f"dataset_{index}",
+            dataset_dir=dataset_dir,
+            audio_dir=audio_dir,
+        )
+        for _ in range(2):
+            await api.datasets.add_file(
+                session,
+                dataset,
+                random_wav_factory(path=dataset_dir / f"{uuid.uuid4()}.wav"),
+                audio_dir=audio_dir,
+            )
+
+    # Act
+    with assert_max_queries(2):
+        datasets, _ = await api.datasets.get_many(session)
+
+    # Page and count, plus one query per recording collection.
+    with assert_max_queries(8):
+        dataset_recordings, _ = await api.datasets.get_recordings(
+            session,
+            dataset,
+        )
+
+    # Assert
+    assert len(datasets) == 3
+    assert all(d.recording_count == 2 for d in datasets)
+    assert len(dataset_recordings) == 2
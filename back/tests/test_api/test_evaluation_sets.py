@@ -0,0 +1,124 @@
+"""Test suite for the Evaluation Sets Python API."""
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from whombat import api, models, schemas
+
+
+async def test_add_tags_skips_existing_tags(
+    session: AsyncSession,
+    tag: schemas.Tag,
+):
+    """Test adding tags in bulk ignores tags already in the set."""
+    evaluation_set = await api.evaluation_sets.create(
+        session,
+        name="test",
+        description="test",
+    )
+    other = await api.tags.create(session, key="other", value="tag")
+    evaluation_set = await api.evaluation_sets.add_tag(
+        session,
+        evaluation_set,
+        tag,
+    )
+
+    evaluation_set = await api.evaluation_sets.add_tags(
+        session,
+        evaluation_set,
+        [tag, other, other],
+    )
+
+    assert [t.id for t in evaluation_set.tags] == [tag.id, other.id]
+    count = await session.scalar(
+        select(func.count()).select_from(models.EvaluationSetTag)
+    )
+    assert count == 2
+
+
+async def test_add_existing_tag_fails_without_querying(
+    session: AsyncSession,
+    tag: schemas.Tag,
+    assert_max_queries,
+):
+    """Test adding a tag already in the set is rejected by its id."""
+    evaluation_set = await api.evaluation_sets.create(
+        session,
+        name="test",
+        description="test",
+    )
+    evaluation_set = await api.evaluation_sets.add_tag(
+        session,
+        evaluation_set,
+        tag,
+    )
+    stale = tag.model_copy(update=dict(value="renamed"))
+
+    with assert_max_queries(0), pytest.raises(ValueError):
+        await api.evaluation_sets.add_tag(session, evaluation_set, stale)
+
+    evaluation_set = await api.evaluation_sets.remove_tag(
+        session,
+        evaluation_set,
+        stale,
+    )
+    assert evaluation_set.tags == []
+
+
+async def test_add_clip_annotations_skips_existing_annotations(
+    session: AsyncSession,
+    clip_annotation: schemas.ClipAnnotation,
+):
+    """Test adding clip annotations in bulk ignores existing links."""
+    evaluation_set = await api.evaluation_sets.create(
+        session,
+        name="test",
+        description="test",
+    )
+    await api.evaluation_sets.add_clip_annotation(
+        session,
+        evaluation_set,
+        clip_annotation,
+    )
+
+    await api.evaluation_sets.add_clip_annotations(
+        session,
+        evaluation_set,
+        [clip_annotation],
+    )
+
+    annotations, count = await api.evaluation_sets.get_clip_annotations(
+        session,
+        evaluation_set,
+    )
+    assert count == 1
+    assert annotations[0].uuid == clip_annotation.uuid
+
+
+async def test_to_soundevent_loads_annotations_in_bulk(
+    session: AsyncSession,
+    clip_annotation: schemas.ClipAnnotation,
+    assert_max_queries,
+):
+    """Test exporting an evaluation set does not query per annotation."""
+    evaluation_set = await api.evaluation_sets.create(
+        session,
+        name="test",
+        description="test",
+    )
+    await api.evaluation_sets.add_clip_annotation(
+        session,
+        evaluation_set,
+        clip_annotation,
+    )
+
+    with assert_max_queries(2):
+        exported = await api.evaluation_sets.to_soundevent(
+            session,
+            evaluation_set,
+        )
+
+    assert [a.uuid for a in exported.clip_annotations] == [
+        clip_annotation.uuid
+    ]
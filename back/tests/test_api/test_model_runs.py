@@ -0,0 +1,36 @@
+"""Test suite for the Model Runs Python API."""
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from whombat import api, schemas
+
+
+async def test_add_clip_predictions_skips_existing_predictions(
+    session: AsyncSession,
+    clip_prediction: schemas.ClipPrediction,
+):
+    """Test adding clip predictions in bulk ignores existing links."""
+    model_run = await api.model_runs.create(
+        session,
+        name="test",
+        version="1.0.0",
+        description="test",
+    )
+    model_run = await api.model_runs.add_clip_prediction(
+        session,
+        model_run,
+        clip_prediction,
+    )
+
+    model_run = await api.model_runs.add_clip_predictions(
+        session,
+        model_run,
+        [clip_prediction, clip_prediction],
+    )
+
+    predictions, count = await api.model_runs.get_clip_predictions(
+        session,
+        model_run,
+    )
+    assert count == 1
+    assert predictions[0].uuid == clip_prediction.uuid
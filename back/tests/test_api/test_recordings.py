@@ -3,15 +3,17 @@
 import datetime
 import shutil
 from collections.abc import Callable
+from contextlib import AbstractContextManager
 from pathlib import Path
 
 import pytest
 from pydantic import ValidationError
-from soundevent.audio import compute_md5_checksum
-from sqlalchemy import select
+from soundevent import data
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from whombat import api, exceptions, models, schemas
+from whombat.core import files
 
 
 async def test_create_recording(
@@ -27,7 +29,7 @@ async def test_create_recording(
         duration=1,
     )
 
-    hash = compute_md5_checksum(path)
+    hash = path.precomputed_hash  # type: ignore
 
     # Act
     recording = await api.recordings.create(
@@ -123,96 +125,40 @@ async def test_create_recording_fails_if_already_exists(
         )
 
 
-async def test_create_recording_with_date(
+@pytest.mark.parametrize(
+    "metadata",
+    [
+        {"date": datetime.date(2021, 1, 1)},
+        {"time": datetime.time(12, 0, 0)},
+        {"latitude": 1.0, "longitude": 2.0},
+    ],
+)
+async def test_create_recording_with_metadata(
     session: AsyncSession,
     random_wav_factory: Callable[..., Path],
     audio_dir: Path,
+    metadata: dict,
 ):
-    """Test creating a recording with a date."""
+    """Test creating a recording with date, time or coordinates."""
     # Arrange
     path = random_wav_factory(
         channels=1,
         samplerate=44100,
         duration=1,
     )
-    date = datetime.date(2021, 1, 1)
 
     # Act
     recording = await api.recordings.create(
         session,
         path=path,
-        date=date,
         audio_dir=audio_dir,
+        **metadata,
     )
 
     # Assert
     assert isinstance(recording, schemas.Recording)
-    assert recording.date == date
-    assert recording.time is None
-    assert recording.latitude is None
-    assert recording.longitude is None
-
-
-async def test_create_recording_with_time(
-    session: AsyncSession,
-    random_wav_factory: Callable[..., Path],
-    audio_dir: Path,
-):
-    """Test creating a recording with a time."""
-    # Arrange
-    path = random_wav_factory(
-        channels=1,
-        samplerate=44100,
-        duration=1,
-    )
-    time = datetime.time(12, 0, 0)
-
-    # Act
-    recording = await api.recordings.create(
-        session,
-        path=path,
-        time=time,
-        audio_dir=audio_dir,
-    )
-
-    # Assert
-    assert isinstance(recording, schemas.Recording)
-    assert recording.date is None
-    assert recording.time == time
-    assert recording.latitude is None
-    assert recording.longitude is None
-
-
-async def test_create_recording_with_coordinates(
-    session: AsyncSession,
-    random_wav_factory: Callable[..., Path],
-    audio_dir: Path,
-):
-    """Test creating a recording with coordinates."""
-    # Arrange
-    path = random_wav_factory(
-        channels=1,
-        samplerate=44100,
-        duration=1,
-    )
-    latitude = 1.0
-    longitude = 2.0
-
-    # Act
-    recording = await api.recordings.create(
-        session,
-        path=path,
-        latitude=latitude,
-        longitude=longitude,
-        audio_dir=audio_dir,
-    )
-
-    # Assert
-    assert isinstance(recording, schemas.Recording)
-    assert recording.date is None
-    assert recording.time is None
-    assert recording.latitude == latitude
-    assert recording.longitude == longitude
+    for field in ["date", "time", "latitude", "longitude"]:
+        assert getattr(recording, field) == metadata.get(field)
 
 
 async def test_create_recording_fails_if_path_does_not_exist(
@@ -287,6 +233,31 @@ async def test_create_recording_with_bad_coordinates_fail(
         )
 
 
+async def test_create_recording_fails_if_not_in_audio_dir(
+    session: AsyncSession,
+    random_wav_factory: Callable[..., Path],
+    tmp_path: Path,
+    audio_dir: Path,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """Test files outside the audio directory are rejected unread."""
+    # Arrange
+    path = random_wav_factory(path=tmp_path / "outside.wav")
+    monkeypatch.setattr(
+        files,
+        "get_file_info",
+        lambda path: pytest.fail("file should not be read"),
+    )
+
+    # Act/Assert
+    with pytest.raises(ValueError):
+        await api.recordings.create(
+            session,
+            path=path,
+            audio_dir=audio_dir,
+        )
+
+
 async def test_get_recording_by_hash(
     session: AsyncSession,
     recording: schemas.Recording,
@@ -312,78 +283,30 @@ async def test_get_recording_by_hash_fails_if_not_found(
         await api.recordings.get_by_hash(session, hash)
 
 
-async def test_update_recording_date(
+@pytest.mark.parametrize(
+    "metadata",
+    [
+        {"date": datetime.date(2021, 1, 1)},
+        {"time": datetime.time(12, 0, 0)},
+        {"latitude": 1.0, "longitude": 2.0},
+    ],
+)
+async def test_update_recording_metadata(
     session: AsyncSession,
     recording: schemas.Recording,
+    metadata: dict,
 ):
-    """Test updating a recording's date."""
-    # Arrange
-    date = datetime.date(2021, 1, 1)
-    assert recording.date is None
-
+    """Test updating a recording's date, time or coordinates."""
     # Act
     updated_recording = await api.recordings.update(
         session,
         recording,
-        data=schemas.RecordingUpdate(date=date),
+        data=schemas.RecordingUpdate(**metadata),
     )
 
     # Assert
-    assert updated_recording.date == date
-    assert recording.time is None
-    assert recording.latitude is None
-    assert recording.longitude is None
-
-
-async def test_update_recording_time(
-    session: AsyncSession,
-    recording: schemas.Recording,
-):
-    """Test updating a recording's time."""
-    # Arrange
-    time = datetime.time(12, 0, 0)
-    assert recording.time is None
-
-    # Act
-    updated_recording = await api.recordings.update(
-        session,
-        recording,
-        data=schemas.RecordingUpdate(time=time),
-    )
-
-    # Assert
-    assert updated_recording.time == time
-    assert recording.date is None
-    assert recording.latitude is None
-    assert recording.longitude is None
-
-
-async def test_update_recording_coordinates(
-    session: AsyncSession,
-    recording: schemas.Recording,
-):
-    """Test updating a recording's coordinates."""
-    # Arrange
-    latitude = 1.0
-    longitude = 2.0
-    assert recording.latitude is None
-    assert recording.longitude is None
-
-    # Act
-    updated_recording = await api.recordings.update(
-        session,
-        recording,
-        data=schemas.RecordingUpdate(
-            latitude=latitude,
-            longitude=longitude,
-        ),
-    )
-
-    # Assert
-    assert updated_recording.latitude == latitude
-    assert updated_recording.longitude == longitude
-    assert recording.date is None
-    assert recording.time is None
+    for field in ["date", "time", "latitude", "longitude"]:
+        assert getattr(updated_recording, field) == metadata.get(field)
 
 
 async def test_update_recording_fails_with_bad_coordinates(
@@ -452,6 +375,65 @@ async def test_delete_recording(
         await api.recordings.get_by_hash(session, recording.hash)
 
 
+async def test_delete_recording_removes_its_sound_events(
+    session: AsyncSession,
+    recording: schemas.Recording,
+):
+    """Test that the sound events of a recording are deleted with it."""
+    # Arrange
+    await api.sound_events.create(
+        session,
+        recording,
+        geometry=data.BoundingBox(coordinates=[0.1, 100, 0.2, 200]),
+    )
+
+    # Act
+    await api.recordings.delete(session, recording)
+
+    # Assert
+    result = await session.execute(
+        select(func.count()).select_from(models.SoundEventFeature)
+    )
+    assert result.scalar_one() == 0
+    result = await session.execute(
+        select(func.count()).select_from(models.SoundEvent)
+    )
+    assert result.scalar_one() == 0
+
+
+async def test_delete_recording_removes_its_clips_and_dependants(
+    session: AsyncSession,
+    recording: schemas.Recording,
+    clip_with_dependants: schemas.Clip,
+):
+    """Test deleting a recording removes its clips and what hangs off them."""
+    # Act
+    await api.recordings.delete(session, recording)
+
+    # Assert
+    for model in [
+        models.Clip,
+        models.SoundEvent,
+        models.ClipAnnotation,
+        models.ClipAnnotationTag,
+        models.ClipAnnotationNote,
+        models.ClipPrediction,
+        models.ClipPredictionTag,
+        models.SoundEventAnnotation,
+        models.SoundEventAnnotationTag,
+        models.SoundEventPrediction,
+        models.SoundEventPredictionTag,
+        models.AnnotationTask,
+        models.AnnotationStatusBadge,
+        models.ModelRunPrediction,
+        models.UserRunPrediction,
+        models.ClipEvaluation,
+        models.SoundEventEvaluation,
+    ]:
+        count = await session.scalar(select(func.count()).select_from(model))
+        assert count == 0, model.__tablename__
+
+
 async def test_add_tag_to_recording(
     session: AsyncSession,
     recording: schemas.Recording,
@@ -470,6 +452,34 @@ async def test_add_tag_to_recording(
     assert tag in recording.tags
 
 
+async def test_add_tag_to_recording_does_not_reload_it(
+    session: AsyncSession,
+    recording: schemas.Recording,
+    tag: schemas.Tag,
+    assert_max_queries: Callable[[int], AbstractContextManager[list[str]]],
+):
+    """Test adding a tag only inserts the association row."""
+    with assert_max_queries(1):
+        await api.recordings.add_tag(session, recording, tag)
+
+
+async def test_add_tag_to_recording_is_undone_by_rollback(
+    session: AsyncSession,
+    recording: schemas.Recording,
+    tag: schemas.Tag,
+):
+    """Test the tag row is not committed before the transaction is."""
+    await session.commit()
+
+    await api.recordings.add_tag(session, recording, tag)
+    await session.rollback()
+
+    count = await session.scalar(
+        select(func.count()).select_from(models.RecordingTag)
+    )
+    assert count == 0
+
+
 async def test_add_existing_tag_to_recording_fails(
     session: AsyncSession,
     recording: schemas.Recording,
@@ -483,6 +493,33 @@ async def test_add_existing_tag_to_recording_fails(
         recording = await api.recordings.add_tag(session, recording, tag)
 
 
+async def test_add_existing_tag_fails_without_querying(
+    session: AsyncSession,
+    recording: schemas.Recording,
+    tag: schemas.Tag,
+    assert_max_queries: Callable[[int], AbstractContextManager[list[str]]],
+):
+    """Test duplicate tags are detected from the loaded recording."""
+    recording = await api.recordings.add_tag(session, recording, tag)
+    renamed = tag.model_copy(update=dict(value="renamed"))
+
+    with assert_max_queries(0):
+        with pytest.raises(exceptions.DuplicateObjectError):
+            await api.recordings.add_tag(session, recording, renamed)
+
+
+async def test_add_tag_with_stale_recording_fails(
+    session: AsyncSession,
+    recording: schemas.Recording,
+    tag: schemas.Tag,
+):
+    """Test the unique constraint catches tags missing from a stale copy."""
+    await api.recordings.add_tag(session, recording, tag)
+
+    with pytest.raises(exceptions.DuplicateObjectError):
+        await api.recordings.add_tag(session, recording, tag)
+
+
 async def test_add_note_to_recording(
     session: AsyncSession,
     recording: schemas.Recording,
@@ -671,6 +708,22 @@ async def test_remove_non_existing_feature_fails(
         )
 
 
+async def _create_recordings(
+    session: AsyncSession,
+    paths: list[Path],
+    audio_dir: Path,
+) -> list[schemas.Recording]:
+    """Create recordings in bulk, returned in the order of the paths."""
+    created = await api.recordings.create_many(
+        session,
+        [{"path": path} for path in paths],
+        audio_dir=audio_dir,
+    )
+    assert created is not None
+    by_path = {recording.path: recording for recording in created}
+    return [by_path[path.relative_to(audio_dir)] for path in paths]
+
+
 async def test_get_recordings(
     session: AsyncSession,
     random_wav_factory: Callable[..., Path],
@@ -683,21 +736,15 @@ async def test_get_recordings(
         samplerate=44100,
         duration=1,
     )
-    recording1 = await api.recordings.create(
-        session,
-        path=path1,
-        audio_dir=audio_dir,
-    )
-
     path2 = random_wav_factory(
         channels=1,
         samplerate=44100,
         duration=1,
     )
-    recording2 = await api.recordings.create(
+    recording1, recording2 = await _create_recordings(
         session,
-        path=path2,
-        audio_dir=audio_dir,
+        [path1, path2],
+        audio_dir,
     )
 
     # Act
@@ -724,21 +771,15 @@ async def test_get_recordings_with_limit(
         samplerate=44100,
         duration=1,
     )
-    recording1 = await api.recordings.create(
-        session,
-        path=path1,
-        audio_dir=audio_dir,
-    )
-
     path2 = random_wav_factory(
         channels=1,
         samplerate=44100,
         duration=1,
     )
-    recording2 = await api.recordings.create(
+    recording1, recording2 = await _create_recordings(
         session,
-        path=path2,
-        audio_dir=audio_dir,
+        [path1, path2],
+        audio_dir,
     )
 
     # Act
@@ -774,21 +815,15 @@ async def test_get_recordings_with_offset(
         samplerate=44100,
         duration=1,
     )
-    recording1 = await api.recordings.create(
-        session,
-        path=path1,
-        audio_dir=audio_dir,
-    )
-
     path2 = random_wav_factory(
         channels=1,
         samplerate=44100,
         duration=1,
     )
-    await api.recordings.create(
+    recording1, _ = await _create_recordings(
         session,
-        path=path2,
-        audio_dir=audio_dir,
+        [path1, path2],
+        audio_dir,
     )
 
     # Act
@@ -0,0 +1,80 @@
+"""Test suite for the Sound Event Predictions Python API."""
+
+import pytest
+from soundevent import data
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from whombat import api, exceptions, schemas
+
+
+async def test_add_tag_issues_a_single_insert(
+    session: AsyncSession,
+    sound_event_prediction: schemas.SoundEventPrediction,
+    tag: schemas.Tag,
+    assert_max_queries,
+):
+    """Test adding a tag does not reload the prediction."""
+    with assert_max_queries(1):
+        updated = await api.sound_event_predictions.add_tag(
+            session,
+            sound_event_prediction,
+            tag,
+            0.7,
+        )
+
+    assert [(t.tag, t.score) for t in updated.tags] == [(tag, 0.7)]
+    fetched = await api.sound_event_predictions.get(
+        session, sound_event_prediction.uuid
+    )
+    assert [(t.tag, t.score) for t in fetched.tags] == [(tag, 0.7)]
+
+    with pytest.raises(exceptions.DuplicateObjectError):
+        await api.sound_event_predictions.add_tag(session, updated, tag, 0.1)
+
+
+async def test_from_soundevent_adds_tags_in_bulk(
+    session: AsyncSession,
+    clip_prediction: schemas.ClipPrediction,
+    sound_event_prediction: schemas.SoundEventPrediction,
+    tag: schemas.Tag,
+    assert_max_queries,
+):
+    """Test importing predicted tags does not query once per tag."""
+    sound_event = await api.sound_events.to_soundevent(
+        session,
+        sound_event_prediction.sound_event,
+    )
+    exported = data.SoundEventPrediction(
+        uuid=sound_event_prediction.uuid,
+        sound_event=sound_event,
+        score=sound_event_prediction.score,
+        tags=[
+            data.PredictedTag(tag=api.tags.to_soundevent(tag), score=0.9),
+            *[
+                data.PredictedTag(
+                    tag=data.Tag(key="species", value=f"species_{i}"),
+                    score=0.5,
+                )
+                for i in range(5)
+            ],
+        ],
+    )
+
+    with assert_max_queries(5):
+        updated = await api.sound_event_predictions.from_soundevent(
+            session,
+            exported,
+            clip_prediction=clip_prediction,
+        )
+
+    assert len(updated.tags) == 6
+    assert updated.tags[0].tag == tag
+    assert updated.tags[0].score == 0.9
+
+    fetched = await api.sound_event_predictions.get(
+        session,
+        sound_event_prediction.uuid,
+    )
+    assert {(t.tag.key, t.tag.value, t.score) for t in fetched.tags} == {
+        (t.tag.key, t.tag.value, t.score) for t in updated.tags
+    }
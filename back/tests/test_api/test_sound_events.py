@@ -3,12 +3,20 @@
 import datetime
 from uuid import UUID
 
+import pytest
 from soundevent.data import geometries
-from sqlalchemy import select
+from sqlalchemy import Integer, select
+from sqlalchemy.exc import InvalidRequestError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from whombat import api, models, schemas
-from whombat.filters.sound_events import RecordingFilter
+from whombat.filters.sound_events import (
+    GeometryTypeFilter,
+    RecordingFilter,
+    TimeEndFilter,
+)
+from whombat.models.base import GEOMETRY_TYPE_CODES
 
 
 async def test_create_a_timestamp_sound_event(
@@ -43,6 +51,146 @@ async def test_create_a_timestamp_sound_event(
     assert db_sound_event.geometry == geometry
 
 
+async def test_sound_event_geometry_is_stored_as_json(
+    session: AsyncSession,
+    recording: schemas.Recording,
+):
+    """Test that the geometry can be queried on the database side."""
+    # Arrange
+    geometry = geometries.BoundingBox(coordinates=[0.1, 100, 0.4, 1000])
+    sound_event = await api.sound_events.create(
+        session,
+        recording,
+        geometry=geometry,
+    )
+
+    # Act
+    stmt = select(models.SoundEvent.geometry["type"].as_string()).where(
+        models.SoundEvent.uuid == sound_event.uuid,
+    )
+    result = await session.execute(stmt)
+
+    # Assert
+    assert result.scalar_one() == "BoundingBox"
+
+
+async def test_sound_event_geometry_type_is_stored_as_code(
+    session: AsyncSession,
+    recording: schemas.Recording,
+):
+    """Test that the geometry type is stored as a small integer code."""
+    # Arrange
+    sound_event = await api.sound_events.create(
+        session,
+        recording,
+        geometry=geometries.Point(coordinates=[0.1, 100]),
+    )
+
+    # Act
+    stmt = select(
+        models.SoundEvent.__table__.c.geometry_type.cast(Integer)
+    ).where(models.SoundEvent.uuid == sound_event.uuid)
+    result = await session.execute(stmt)
+    sound_events, _ = await api.sound_events.get_many(
+        session,
+        filters=[GeometryTypeFilter(eq="Point")],
+    )
+
+    # Assert
+    assert result.scalar_one() == GEOMETRY_TYPE_CODES["Point"]
+    assert [s.uuid for s in sound_events] == [sound_event.uuid]
+
+
+async def test_sound_event_bounds_are_stored_in_columns(
+    session: AsyncSession,
+    recording: schemas.Recording,
+):
+    """Test that the geometry bounds are stored and kept up to date."""
+    # Arrange
+    sound_event = await api.sound_events.create(
+        session,
+        recording,
+        geometry=geometries.BoundingBox(coordinates=[0.1, 100, 0.4, 1000]),
+    )
+
+    # Act
+    await api.sound_events.update(
+        session,
+        sound_event,
+        schemas.SoundEventUpdate(
+            geometry=geometries.TimeInterval(coordinates=[0.5, 0.6]),
+        ),
+    )
+    db_sound_event = await session.get(models.SoundEvent, sound_event.id)
+
+    # Assert
+    assert db_sound_event is not None
+    assert db_sound_event.geometry_type == "TimeInterval"
+    assert db_sound_event.time_start == 0.5
+    assert db_sound_event.time_end == 0.6
+
+
+async def test_filter_sound_events_by_time_bounds(
+    session: AsyncSession,
+    recording: schemas.Recording,
+):
+    """Test that sound events can be filtered by their time bounds."""
+    # Arrange
+    early = await api.sound_events.create(
+        session,
+        recording,
+        geometry=geometries.TimeInterval(coordinates=[0.1, 0.2]),
+    )
+    await api.sound_events.create(
+        session,
+        recording,
+        geometry=geometries.TimeInterval(coordinates=[0.5, 0.6]),
+    )
+
+    # Act
+    sound_events, _ = await api.sound_events.get_many(
+        session,
+        filters=[TimeEndFilter(lt=0.3)],
+    )
+
+    # Assert
+    assert [s.uuid for s in sound_events] == [early.uuid]
+
+
+async def test_sound_event_recordings_are_loaded_in_bulk(
+    session: AsyncSession,
+    recording: schemas.Recording,
+):
+    """Test that sound event recordings must be loaded explicitly."""
+    # Arrange
+    for start_time in [0.1, 0.2, 0.3]:
+        await api.sound_events.create(
+            session,
+            recording,
+            geometry=geometries.TimeStamp(coordinates=start_time),
+        )
+    session.expunge_all()
+    query = select(models.SoundEvent).options(
+        selectinload(models.SoundEvent.features),
+        selectinload(models.SoundEvent.recording),
+    )
+
+    # Act
+    result = await session.stream_scalars(
+        query.execution_options(yield_per=2),
+    )
+    recording_ids = [sound_event.recording.id async for sound_event in result]
+
+    # Assert
+    assert recording_ids == [recording.id] * 3
+
+    session.expunge_all()
+    result = await session.execute(select(models.SoundEvent))
+    sound_event = result.unique().scalars().first()
+    with pytest.raises(InvalidRequestError):
+        sound_event.recording  # noqa: B018
+
+
 async def test_create_a_timeinterval_sound_event(
     session: AsyncSession,
     recording: schemas.Recording,
@@ -3,7 +3,10 @@
 import datetime
 
 import pytest
-from sqlalchemy import select
+from soundevent import data
+from soundevent.terms import add_term, remove_term
+from sqlalchemy import delete, func, select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from whombat import api, exceptions, models, schemas
@@ -130,6 +133,27 @@ async def test_delete_tag_nonexistent_should_fail(
         await api.tags.delete(session, tag)
 
 
+async def test_delete_tag_in_use_keeps_the_tagged_rows(
+    session: AsyncSession,
+    recording: schemas.Recording,
+    tag: schemas.Tag,
+) -> None:
+    """Test the database refuses to delete a tag that is still in use."""
+    await api.recordings.add_tag(session, recording, tag)
+    await session.commit()
+
+    with pytest.raises(IntegrityError):
+        await session.execute(
+            delete(models.Tag).where(models.Tag.id == tag.id)
+        )
+    await session.rollback()
+
+    count = await session.scalar(
+        select(func.count()).select_from(models.RecordingTag)
+    )
+    assert count == 1
+
+
 async def test_get_tag_by_key_and_value(
     session: AsyncSession,
 ) -> None:
@@ -261,6 +285,23 @@ async def test_get_tags(
     assert retrieved_tags[1].value == "test_value1"
 
 
+async def test_get_tags_does_not_load_orm_objects(
+    session: AsyncSession,
+):
+    """Test listing tags validates the rows without building ORM objects."""
+    tag = await api.tags.create(session, key="test_key", value="test_value")
+    session.expunge_all()
+
+    retrieved_tags, count = await api.tags.get_many(
+        session,
+        filters=[models.Tag.key == "test_key"],
+    )
+
+    assert count == 1
+    assert retrieved_tags == [tag]
+    assert len(session.identity_map) == 0
+
+
 async def test_get_tags_with_offset(
     session: AsyncSession,
 ):
@@ -414,3 +455,62 @@ async def test_get_or_create_tags_with_existing_and_nonexisting_tags(
     assert len(created_tags) == 1
     assert created_tags[0].key == "test_key2"
     assert created_tags[0].value == "test_value2"
+
+
+async def test_create_many_without_duplicates_returns_existing_tags(
+    session: AsyncSession,
+    assert_max_queries,
+):
+    """Test creating tags in bulk with return_all returns every tag.
+
+    The tags come back in the order they were given, not with the
+    existing ones first.
+    """
+    existing = await api.tags.create(session, key="test_key", value="old")
+
+    with assert_max_queries(3):
+        created = await api.tags.create_many_without_duplicates(
+            session,
+            [
+                dict(key="test_key", value="new"),
+                dict(key="test_key", value="old"),
+                dict(key="test_key", value="new"),
+            ],
+            return_all=True,
+        )
+
+    assert [(tag.key, tag.value) for tag in created] == [
+        ("test_key", "new"),
+        ("test_key", "old"),
+    ]
+    assert created[1] == existing
+
+
+async def test_to_soundevent_reuses_the_term_of_a_key(
+    session: AsyncSession,
+):
+    """Test exported tags with the same key share their term."""
+    first = await api.tags.create(session, key="test_key", value="first")
+    second = await api.tags.create(session, key="test_key", value="second")
+
+    exported_first = api.tags.to_soundevent(first)
+    exported_second = api.tags.to_soundevent(second)
+
+    assert exported_first.term is exported_second.term
+    assert exported_first.key == "test_key"
+    assert exported_second.value == "second"
+
+
+async def test_to_soundevent_uses_terms_registered_later(
+    session: AsyncSession,
+):
+    """Test a term registered after an export is used by the next one."""
+    tag = await api.tags.create(session, key="late_key", value="value")
+    assert api.tags.to_soundevent(tag).term.definition == "Unknown"
+
+    term = data.Term(label="Late", name="late_key", definition="Late term")
+    add_term(term, key="late_key")
+    try:
+        assert api.tags.to_soundevent(tag).term == term
+    finally:
+        remove_term("late_key")
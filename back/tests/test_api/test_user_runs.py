@@ -0,0 +1,117 @@
+"""Test suite for the User Runs Python API."""
+
+import math
+from uuid import uuid4
+
+from soundevent import data
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from whombat import api, models, schemas
+
+
+async def test_add_clip_predictions_skips_existing_predictions(
+    session: AsyncSession,
+    user: schemas.SimpleUser,
+    clip_prediction: schemas.ClipPrediction,
+):
+    """Test adding clip predictions in bulk ignores existing links."""
+    user_run = await api.user_runs.create(session, user=user)
+    user_run = await api.user_runs.add_clip_prediction(
+        session,
+        user_run,
+        clip_prediction,
+    )
+
+    user_run = await api.user_runs.add_clip_predictions(
+        session,
+        user_run,
+        [clip_prediction, clip_prediction],
+    )
+
+    predictions, count = await api.user_runs.get_clip_predictions(
+        session,
+        user_run,
+    )
+    assert count == 1
+    assert predictions[0].uuid == clip_prediction.uuid
+
+
+async def test_to_soundevent_exports_predictions_in_batches(
+    session: AsyncSession,
+    user: schemas.SimpleUser,
+    recording: schemas.Recording,
+    assert_max_queries,
+):
+    """Test exporting a user run pages through all its clip predictions."""
+    user_run = await api.user_runs.create(session, user=user)
+    predictions = []
+    for index in range(3):
+        clip = await api.clips.create(
+            session,
+            recording=recording,
+            start_time=index,
+            end_time=index + 0.5,
+        )
+        uuid = uuid4()
+        await api.common.insert_object(
+            session,
+            models.ClipPrediction,
+            clip_id=clip.id,
+            uuid=uuid,
+        )
+        predictions.append(await api.clip_predictions.get(session, uuid))
+    user_run = await api.user_runs.add_clip_predictions(
+        session,
+        user_run,
+        predictions,
+    )
+
+    batch_size = 2
+    # NOTE: Each page is one query on the clip predictions and one to load
+    # their sound event predictions.
+    pages = math.ceil(len(predictions) / batch_size)
+    with assert_max_queries(2 * pages) as statements:
+        exported = await api.user_runs.to_soundevent(
+            session,
+            user_run,
+            batch_size=batch_size,
+        )
+
+    assert [cp.uuid for cp in exported.clip_predictions] == [
+        cp.uuid for cp in predictions
+    ]
+    page_queries = [
+        statement
+        for statement in statements
+        if "FROM clip_prediction" in statement
+    ]
+    assert len(page_queries) == pages
+    assert not any("count(" in statement for statement in statements)
+
+
+async def test_from_soundevent_ignores_repeated_clip_predictions(
+    session: AsyncSession,
+    user: schemas.SimpleUser,
+    clip_prediction: schemas.ClipPrediction,
+):
+    """Test importing a prediction set with repeated clip predictions."""
+    exported = await api.clip_predictions.to_soundevent(
+        session,
+        clip_prediction,
+    )
+    prediction_set = data.PredictionSet(
+        clip_predictions=[exported, exported],
+    )
+
+    user_run = await api.user_runs.from_soundevent(
+        session,
+        prediction_set,
+        user=user,
+    )
+
+    predictions, count = await api.user_runs.get_clip_predictions(
+        session,
+        user_run,
+    )
+    assert count == 1
+    assert predictions[0].uuid == clip_prediction.uuid
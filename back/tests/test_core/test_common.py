@@ -0,0 +1,26 @@
+"""Test suite of Whombat common core functions."""
+
+import pytest
+
+from whombat.core import common
+
+
+def test_batched_splits_iterable_into_chunks():
+    """Test that batched yields tuples of the requested size."""
+    assert list(common.batched(range(5), 2)) == [(0, 1), (2, 3), (4,)]
+
+
+def test_batched_with_empty_iterable():
+    """Test that batched yields nothing for an empty iterable."""
+    assert list(common.batched([], 3)) == []
+
+
+def test_batched_fails_with_invalid_size():
+    """Test that batched rejects batch sizes smaller than one."""
+    with pytest.raises(ValueError):
+        list(common.batched([1, 2, 3], 0))
+
+
+def test_remove_duplicates_preserves_order():
+    """Test that remove_duplicates keeps the first occurrence."""
+    assert common.remove_duplicates([3, 1, 3, 2, 1]) == [3, 1, 2]
@@ -4,6 +4,7 @@ from collections.abc import Callable
 from pathlib import Path
 
 import pytest
+from soundevent.audio import compute_md5_checksum
 
 from whombat.core import files
 
@@ -72,3 +73,39 @@ def test_get_audio_files_in_folder(
         Path("wav2.WAV"),
         Path("foo") / "wav3.wav",
     }
+
+
+def test_compute_hash_matches_soundevent_checksum(
+    tmp_path: Path,
+    random_wav_factory: Callable[..., Path],
+):
+    """Test the hash is the MD5 checksum soundevent computes."""
+    path = random_wav_factory(path=tmp_path / "test.wav")
+    assert files.compute_hash(path) == compute_md5_checksum(path)
+
+
+def test_compute_hash_of_empty_file(tmp_path: Path):
+    """Test an empty file can be hashed."""
+    path = tmp_path / "empty.wav"
+    path.touch()
+    assert files.compute_hash(path) == compute_md5_checksum(path)
+
+
+def test_get_file_info_does_not_hash_unreadable_audio(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """Test a file that is not valid audio is not hashed."""
+    path = tmp_path / "broken.wav"
+    path.write_bytes(b"not a wav file")
+    monkeypatch.setattr(
+        files,
+        "compute_hash",
+        lambda path: pytest.fail("file should not be hashed"),
+    )
+
+    info = files.get_file_info(path)
+
+    assert info.is_audio
+    assert info.media_info is None
+    assert info.hash is None
@@ -1,12 +1,18 @@
 """Test suite to check database integrity."""
 
 import inspect
+import json
 
+import pytest
 import sqlalchemy
+from soundevent import data
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from whombat import models
+from whombat.models.base import GeometryType
+from whombat.system.database import create_async_db_engine, warm_up_db_engine
 
 
 def check_all_tables_exist(session: Session):
@@ -22,3 +28,33 @@ def check_all_tables_exist(session: Session):
 async def test_can_create_all_models(session: AsyncSession):
     """Test that all models can be created."""
     await session.run_sync(check_all_tables_exist)
+
+
+@pytest.mark.parametrize("dialect", [sqlite.dialect(), postgresql.dialect()])
+def test_geometry_type_round_trip(dialect):
+    """Test that geometries survive the JSON text and decoded forms."""
+    geometry = data.BoundingBox(coordinates=[0.1, 100, 0.4, 1000])
+    column_type = GeometryType()
+    bind = column_type.bind_processor(dialect)
+    result = column_type.result_processor(dialect, None)
+
+    raw = bind(geometry)
+
+    assert result(raw) == geometry
+    assert result(json.loads(raw)) == geometry
+    assert bind(None) is None
+    assert result(None) is None
+
+
+async def test_warm_up_db_engine_fills_the_pool(tmp_path):
+    """Test warming up an engine leaves its connections in the pool."""
+    engine = create_async_db_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'test.db'}",
+        pool_size=7,
+    )
+
+    await warm_up_db_engine(engine, 7)
+
+    assert engine.pool.size() == 7  # type: ignore
+    assert engine.pool.checkedin() == 7  # type: ignore
+    await engine.dispose()
@@ -359,3 +359,49 @@ async def test_issues_filter(
     # Assert
     assert len(results) == 1
     assert results[0].hash == recording_list[1].hash
+
+
+async def test_dataset_filter(
+    session: AsyncSession,
+    random_wav_factory: Callable[..., Path],
+    audio_dir: Path,
+):
+    """Test the dataset filter with a recording shared by two datasets."""
+    # Arrange
+    outer_dir = audio_dir / "outer"
+    inner_dir = outer_dir / "inner"
+    inner_dir.mkdir(parents=True)
+    outer = await api.datasets.create(
+        session,
+        name="outer",
+        dataset_dir=outer_dir,
+        audio_dir=audio_dir,
+    )
+    inner = await api.datasets.create(
+        session,
+        name="inner",
+        dataset_dir=inner_dir,
+        audio_dir=audio_dir,
+    )
+    shared = random_wav_factory(path=inner_dir / "shared.wav")
+    only_outer = random_wav_factory(path=outer_dir / "outer.wav")
+    for path in [shared, only_outer]:
+        await api.datasets.add_file(session, outer, path, audio_dir=audio_dir)
+    await api.datasets.add_file(session, inner, shared, audio_dir=audio_dir)
+
+    # Act
+    outer_results, _ = await api.recordings.get_many(
+        session=session,
+        filters=[recording_filters.DatasetFilter(eq=outer.uuid)],
+    )
+    inner_results, _ = await api.recordings.get_many(
+        session=session,
+        filters=[recording_filters.DatasetFilter(eq=inner.uuid)],
+    )
+
+    # Assert
+    assert {r.path for r in outer_results} == {
+        Path("outer/inner/shared.wav"),
+        Path("outer/outer.wav"),
+    }
+    assert [r.path for r in inner_results] == [Path("outer/inner/shared.wav")]
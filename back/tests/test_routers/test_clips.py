@@ -0,0 +1,27 @@
+"""Test suite for the Clips endpoints."""
+
+from fastapi.testclient import TestClient
+
+from whombat import schemas
+
+
+async def test_create_clips_assigns_a_uuid_to_each_new_clip(
+    client: TestClient,
+    recording: schemas.Recording,
+    cookies: dict[str, str],
+):
+    recording_uuid = str(recording.uuid)
+    response = client.post(
+        "/api/v1/clips/",
+        json=[
+            [recording_uuid, {"start_time": 0, "end_time": 0.05}],
+            [recording_uuid, {"start_time": 0.05, "end_time": 0.1}],
+            [recording_uuid, {"start_time": 0, "end_time": 0.05}],
+        ],
+        cookies=cookies,
+    )
+
+    assert response.status_code == 200
+    content = response.json()
+    assert len(content) == 2
+    assert len({clip["uuid"] for clip in content}) == 2